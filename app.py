@@ -906,8 +906,8 @@ def validated_text_input(
         is_valid, error_msg = validator_func(new_value)
         if not is_valid:
             st.session_state.validation_errors[field_name] = error_msg
-        elif field_name in st.session_state.validation_errors:
-            del st.session_state.validation_errors[field_name]
+        else:
+            st.session_state.validation_errors.pop(field_name, None)
 
     # Get current error
     error_msg = st.session_state.validation_errors.get(field_name)
@@ -991,8 +991,8 @@ def validated_date_input(label: str, field_name: str, value=None, key: str = Non
         is_valid, error_msg = validator.validate_date(new_value, label)
         if not is_valid:
             st.session_state.validation_errors[field_name] = error_msg
-        elif field_name in st.session_state.validation_errors:
-            del st.session_state.validation_errors[field_name]
+        else:
+            st.session_state.validation_errors.pop(field_name, None)
 
     # Get current error
     error_msg = st.session_state.validation_errors.get(field_name)
@@ -1391,8 +1391,8 @@ def render_step_1_contact():
                 is_valid, error_msg = validator.validate_city_state(city_state)
                 if not is_valid:
                     st.session_state.validation_errors["city_state"] = error_msg
-                elif "city_state" in st.session_state.validation_errors:
-                    del st.session_state.validation_errors["city_state"]
+                else:
+                    st.session_state.validation_errors.pop("city_state", None)
             error_msg = st.session_state.validation_errors.get("city_state")
             st.text_input(
                 "City, State (State optional)",
@@ -5,7 +5,7 @@ Clean, professional preview with DOCX and JSON downloads using mammoth library
 
 import streamlit as st
 import json
-from utils.resume_preview import render_docx_preview
+from utils.resume_preview import prewarm_preview, render_docx_preview
 import datetime
 
 
@@ -38,6 +38,7 @@ def render_step_4(resume_service):
                         output_path = resume_service.generate_resume(profile, template_name="classic")
                         
                         st.session_state.generated_resume_path = output_path
+                        prewarm_preview(output_path)
                         st.success(" Resume generated successfully!")
                         st.rerun()
                 else:
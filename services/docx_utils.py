@@ -7,8 +7,77 @@ from typing import Optional, List, Tuple, Dict
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING, WD_TAB_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
+from docx.text.paragraph import Paragraph
+
+
+# Cell border edges in CT_TcBorders schema order, and their attributes
+_CELL_BORDER_EDGES = ('top', 'start', 'left', 'bottom', 'end', 'right', 'insideH', 'insideV')
+_CELL_BORDER_RANK = {qn(f'w:{edge}'): rank for rank, edge in enumerate(_CELL_BORDER_EDGES)}
+_CELL_BORDER_ATTRS = ('sz', 'val', 'color', 'space', 'shadow')
+_CELL_BORDERS_TMPL = '<w:tcBorders {nsdecls}>{edges}</w:tcBorders>'
+
+# Empty spacing paragraph; w:after is in twentieths of a point
+_SPACING_PARA_TMPL = '<w:p {nsdecls}><w:pPr><w:spacing w:after="{after}"/></w:pPr></w:p>'
+_SECT_PR_TAG = qn('w:sectPr')
+
+
+def _append_body_element(doc: Document, element):
+    """
+    Append a block element to the document body, keeping sectPr last.
+    Only the last body child is inspected, whereas doc.add_paragraph
+    searches the whole body for sectPr on every call.
+    
+    Args:
+        doc: Document object
+        element: Block-level element (w:p, w:tbl)
+    
+    Returns:
+        The appended element
+    """
+    body = doc.element.body
+    try:
+        last = body[-1]
+    except IndexError:
+        last = None
+    if last is not None and last.tag == _SECT_PR_TAG:
+        last.addprevious(element)
+    else:
+        body.append(element)
+    return element
+
+
+def append_paragraph(doc: Document, text: str = '') -> Paragraph:
+    """
+    Append a paragraph to the end of the document body.
+    Use instead of doc.add_paragraph when building sections in loops.
+    
+    Args:
+        doc: Document object
+        text: Optional paragraph text, added as a single run
+    
+    Returns:
+        The new paragraph
+    """
+    p = _append_body_element(doc, OxmlElement('w:p'))
+    paragraph = Paragraph(p, doc._body)
+    if text:
+        paragraph.add_run(text)
+    return paragraph
+
+
+def _add_spacing_paragraph(doc: Document, space_after: int):
+    """
+    Append an empty paragraph used as vertical spacing.
+    
+    Args:
+        doc: Document object
+        space_after: Space after in points
+    """
+    _append_body_element(doc, parse_xml(_SPACING_PARA_TMPL.format(
+        nsdecls=nsdecls('w'), after=space_after * 20
+    )))
 
 
 def set_page_margins(doc: Document, 
@@ -44,7 +113,7 @@ def add_heading_with_line(doc: Document, text: str, font_size: int = 11) -> None
         font_size: Font size in points
     """
     # Add horizontal line first
-    line_para = doc.add_paragraph()
+    line_para = append_paragraph(doc)
     line_para.paragraph_format.space_before = Pt(0)
     line_para.paragraph_format.space_after = Pt(0)
     
@@ -60,7 +129,7 @@ def add_heading_with_line(doc: Document, text: str, font_size: int = 11) -> None
     pPr.append(pBdr)
     
     # Add heading text below the line
-    paragraph = doc.add_paragraph()
+    paragraph = append_paragraph(doc)
     paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = paragraph.add_run(text.upper())
     run.bold = False
@@ -94,7 +163,7 @@ def add_contact_header(doc: Document,
         clearance: Security clearance level
     """
     # Name - centered, large, bold
-    name_para = doc.add_paragraph()
+    name_para = append_paragraph(doc)
     name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     name_run = name_para.add_run(name.upper())
     name_run.bold = True
@@ -103,7 +172,7 @@ def add_contact_header(doc: Document,
     name_para.paragraph_format.space_after = Pt(2)
     
     # Contact info - centered, smaller
-    contact_para = doc.add_paragraph()
+    contact_para = append_paragraph(doc)
     contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     
     contact_parts = [location, phone, email]
@@ -127,7 +196,7 @@ def add_branch_title(doc: Document, branch_title: str) -> None:
         doc: Document object
         branch_title: Branch and MOS title
     """
-    para = doc.add_paragraph()
+    para = append_paragraph(doc)
     para.alignment = WD_ALIGN_PARAGRAPH.CENTER
     run = para.add_run(branch_title.upper())
     run.bold = True
@@ -146,7 +215,7 @@ def add_summary_section(doc: Document, summary: str) -> None:
     """
     add_heading_with_line(doc, "SUMMARY")
     
-    para = doc.add_paragraph(summary)
+    para = append_paragraph(doc, summary)
     para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     para.paragraph_format.space_after = Pt(2)
     
@@ -269,8 +338,7 @@ def add_experience_entry(doc: Document,
     date_para.paragraph_format.space_after = Pt(0)
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(2)
+    _add_spacing_paragraph(doc, 2)
 
 
 def add_experience_section_table(doc: Document, experiences: List[Dict]) -> None:
@@ -369,8 +437,7 @@ def add_experience_section_table(doc: Document, experiences: List[Dict]) -> None
         right_para.paragraph_format.space_after = Pt(0)
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacing_paragraph(doc, 4)
 
 
 def add_education_certification_combined_table(doc: Document, education_list: List[Dict], certifications: List[Dict]) -> None:
@@ -547,8 +614,7 @@ def add_education_certification_combined_table(doc: Document, education_list: Li
         right_para.paragraph_format.space_after = Pt(2)
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacing_paragraph(doc, 4)
 
 
 def add_education_section_table(doc: Document, education_list: List[Dict]) -> None:
@@ -658,8 +724,7 @@ def add_education_section_table(doc: Document, education_list: List[Dict]) -> No
         right_para.paragraph_format.space_after = Pt(0)
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacing_paragraph(doc, 4)
 
 
 def add_certification_section_table(doc: Document, certifications: List[Dict]) -> None:
@@ -747,8 +812,7 @@ def add_certification_section_table(doc: Document, certifications: List[Dict]) -
             cert_idx += 1
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacing_paragraph(doc, 4)
 
 
 def add_education_entry(doc: Document,
@@ -814,7 +878,7 @@ def add_education_entry(doc: Document,
     grad_para.paragraph_format.space_after = Pt(0)
     
     # Institution and location
-    inst_para = doc.add_paragraph()
+    inst_para = append_paragraph(doc)
     inst_run = inst_para.add_run(f"{institution}, {location}")
     inst_run.font.size = Pt(10)
     inst_run.font.name = 'Calibri Light'
@@ -823,7 +887,7 @@ def add_education_entry(doc: Document,
     
     # Add overview if present
     if overview:
-        overview_para = doc.add_paragraph(f"• {overview}")
+        overview_para = append_paragraph(doc, f"• {overview}")
         overview_para.paragraph_format.left_indent = Inches(0.25)
         overview_para.paragraph_format.first_line_indent = Inches(-0.25)
         overview_para.paragraph_format.space_after = Pt(2)
@@ -839,7 +903,7 @@ def add_education_entry(doc: Document,
         if gpa:
             honors_parts.append(gpa)
         honors_text = '; '.join(honors_parts)
-        honors_para = doc.add_paragraph(f"• {honors_text}")
+        honors_para = append_paragraph(doc, f"• {honors_text}")
         honors_para.paragraph_format.left_indent = Inches(0.25)
         honors_para.paragraph_format.first_line_indent = Inches(-0.25)
         honors_para.paragraph_format.space_after = Pt(2)
@@ -849,7 +913,7 @@ def add_education_entry(doc: Document,
     
     # Add courses overview if present
     if courses_overview:
-        courses_para = doc.add_paragraph(f"• {courses_overview}")
+        courses_para = append_paragraph(doc, f"• {courses_overview}")
         courses_para.paragraph_format.left_indent = Inches(0.25)
         courses_para.paragraph_format.first_line_indent = Inches(-0.25)
         courses_para.paragraph_format.space_after = Pt(2)
@@ -860,7 +924,7 @@ def add_education_entry(doc: Document,
     # Add courses list if present
     if courses and len(courses) > 0:
         courses_text = ', '.join(courses)
-        courses_para = doc.add_paragraph(f"• Courses: {courses_text}")
+        courses_para = append_paragraph(doc, f"• Courses: {courses_text}")
         courses_para.paragraph_format.left_indent = Inches(0.25)
         courses_para.paragraph_format.first_line_indent = Inches(-0.25)
         courses_para.paragraph_format.space_after = Pt(2)
@@ -869,8 +933,7 @@ def add_education_entry(doc: Document,
             run.font.name = 'Calibri Light'
     
     # Add spacing after entry
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(4)
+    _add_spacing_paragraph(doc, 4)
 
 
 def add_certification_entry(doc: Document,
@@ -940,105 +1003,107 @@ def add_volunteer_entry(doc: Document,
         date_range: Date range (e.g., "January 2020 - Present")
         description: Optional description of volunteer work
     """
-    # Create table for title row (role on left, date on right)
-    table = doc.add_table(rows=1, cols=2)
+    add_volunteer_section(doc, [{
+        'role': role,
+        'organization': organization,
+        'location': location,
+        'date_range': date_range,
+        'description': description
+    }])
+
+
+def add_volunteer_section(doc: Document, entries: List[Dict]) -> None:
+    """
+    Add volunteer experience entries as rows of a single table.
+    Entries are separated by a borderless spacer row, so the column divider
+    breaks between entries as it did with one table per entry.
+    
+    Args:
+        doc: Document object
+        entries: List of volunteer dictionaries with keys: role, organization,
+            location, date_range and optional description
+    """
+    if not entries:
+        return
+    
+    # Entry rows are even; odd rows are the spacers between entries
+    table = doc.add_table(rows=2 * len(entries) - 1, cols=2)
     table.autofit = False
     table.allow_autofit = False
     
-    # Calculate full width (page width - margins)
-    # Page width is 8.5", left margin 0.7", right margin 0.7" = 7.1" available
-    full_width = Inches(7.1)
-    
     # Set column widths with 75/25 ratio
     table.columns[0].width = Inches(5.325)  # 75% of 7.1"
     table.columns[1].width = Inches(1.775)  # 25% of 7.1"
     
-    # Add vertical border between columns only
-    for row in table.rows:
-        for idx, cell in enumerate(row.cells):
-            tc = cell._tc
-            tcPr = tc.get_or_add_tcPr()
-            borders = tcPr.first_child_found_in("w:tcBorders")
-            if borders is None:
-                borders = OxmlElement('w:tcBorders')
-                tcPr.append(borders)
-            
-            # Add vertical divider between cells
-            if idx == 0:
-                # Right border on left cell
-                right = OxmlElement('w:right')
-                right.set(qn('w:val'), 'single')
-                right.set(qn('w:sz'), '6')
-                right.set(qn('w:space'), '0')
-                right.set(qn('w:color'), '000000')
-                borders.append(right)
-            else:
-                # Left border on right cell
-                left = OxmlElement('w:left')
-                left.set(qn('w:val'), 'single')
-                left.set(qn('w:sz'), '6')
-                left.set(qn('w:space'), '0')
-                left.set(qn('w:color'), '000000')
-                borders.append(left)
-            
-            # Remove other borders
-            for edge in ['top', 'bottom']:
-                edge_elem = OxmlElement(f'w:{edge}')
-                edge_elem.set(qn('w:val'), 'none')
-                edge_elem.set(qn('w:sz'), '0')
-                borders.append(edge_elem)
-    
-    # Role cell (left)
-    role_cell = table.rows[0].cells[0]
-    role_para = role_cell.paragraphs[0]
-    role_run = role_para.add_run(role)
-    role_run.bold = True
-    role_run.font.size = Pt(11)
-    role_run.font.name = 'Calibri Light'
-    role_para.paragraph_format.space_after = Pt(0)
-    
-    # Add organization and location on the same line
-    role_para.add_run(', ')
-    org_run = role_para.add_run(organization)
-    org_run.font.italic = True
-    org_run.font.size = Pt(10)
-    org_run.font.name = 'Calibri Light'
-    org_run.bold = False
+    # Read the cell grid once; row/cell accessors rebuild it on every call
+    cells = table._cells
     
-    if location and location != organization:
+    for idx, vol in enumerate(entries):
+        role_cell = cells[4 * idx]
+        date_cell = cells[4 * idx + 1]
+        
+        # Add vertical border between columns only
+        set_cell_border(role_cell, right={"val": "single", "sz": 6, "space": 0, "color": "000000"},
+                        top={"val": "none", "sz": 0}, bottom={"val": "none", "sz": 0})
+        set_cell_border(date_cell, left={"val": "single", "sz": 6, "space": 0, "color": "000000"},
+                        top={"val": "none", "sz": 0}, bottom={"val": "none", "sz": 0})
+        
+        # Spacer row: same gap as the empty paragraph between entry tables
+        if idx:
+            for cell in cells[4 * idx - 2:4 * idx]:
+                cell.paragraphs[0].paragraph_format.space_after = Pt(2)
+        
+        organization = vol.get('organization', '')
+        location = vol.get('location', '')
+        
+        # Role (left)
+        role_para = role_cell.paragraphs[0]
+        role_run = role_para.add_run(vol.get('role', 'Volunteer'))
+        role_run.bold = True
+        role_run.font.size = Pt(11)
+        role_run.font.name = 'Calibri Light'
+        role_para.paragraph_format.space_after = Pt(0)
+        
+        # Add organization and location on the same line
         role_para.add_run(', ')
-        loc_run = role_para.add_run(location)
-        loc_run.font.italic = True
-        loc_run.font.size = Pt(10)
-        loc_run.font.name = 'Calibri Light'
-        loc_run.bold = False
-    
-    # Add description inside the left cell if present
-    if description:
-        desc_para = role_cell.add_paragraph(f'• {description}')
-        desc_para.paragraph_format.left_indent = Inches(0.15)
-        desc_para.paragraph_format.first_line_indent = Inches(-0.15)
-        desc_para.paragraph_format.space_before = Pt(0)
-        desc_para.paragraph_format.space_after = Pt(0)
-        desc_para.paragraph_format.line_spacing = 1.0
+        org_run = role_para.add_run(organization)
+        org_run.font.italic = True
+        org_run.font.size = Pt(10)
+        org_run.font.name = 'Calibri Light'
+        org_run.bold = False
         
-        for run in desc_para.runs:
-            run.font.size = Pt(10)
-            run.font.name = 'Calibri Light'
-    
-    # Date cell (right)
-    date_cell = table.rows[0].cells[1]
-    date_para = date_cell.paragraphs[0]
-    date_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    date_run = date_para.add_run(date_range)
-    date_run.font.size = Pt(10)
-    date_run.font.name = 'Calibri Light'
-    date_run.italic = False
-    date_para.paragraph_format.space_after = Pt(0)
+        if location and location != organization:
+            role_para.add_run(', ')
+            loc_run = role_para.add_run(location)
+            loc_run.font.italic = True
+            loc_run.font.size = Pt(10)
+            loc_run.font.name = 'Calibri Light'
+            loc_run.bold = False
+        
+        # Add description inside the left cell if present
+        if vol.get('description'):
+            desc_para = role_cell.add_paragraph(f"• {vol['description']}")
+            desc_para.paragraph_format.left_indent = Inches(0.15)
+            desc_para.paragraph_format.first_line_indent = Inches(-0.15)
+            desc_para.paragraph_format.space_before = Pt(0)
+            desc_para.paragraph_format.space_after = Pt(0)
+            desc_para.paragraph_format.line_spacing = 1.0
+            
+            for run in desc_para.runs:
+                run.font.size = Pt(10)
+                run.font.name = 'Calibri Light'
+        
+        # Date cell (right)
+        date_para = date_cell.paragraphs[0]
+        date_para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        date_run = date_para.add_run(vol.get('date_range', ''))
+        date_run.font.size = Pt(10)
+        date_run.font.name = 'Calibri Light'
+        date_run.italic = False
+        date_para.paragraph_format.space_after = Pt(0)
     
     # Add spacing after table
-    spacing_para = doc.add_paragraph()
-    spacing_para.paragraph_format.space_after = Pt(2)
+    _add_spacing_paragraph(doc, 2)
 
 
 def add_skills_section(doc: Document, skills_text: str) -> None:
@@ -1051,7 +1116,7 @@ def add_skills_section(doc: Document, skills_text: str) -> None:
     """
     add_heading_with_line(doc, "SKILLS")
     
-    para = doc.add_paragraph(skills_text)
+    para = append_paragraph(doc, skills_text)
     para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
     para.paragraph_format.space_after = Pt(8)
     
@@ -1066,33 +1131,43 @@ def set_cell_border(cell, **kwargs):
     
     Args:
         cell: Table cell
-        **kwargs: Border settings (top, bottom, start, end)
+        **kwargs: Border settings (top, bottom, start, end, left, right)
     """
     tc = cell._tc
     tcPr = tc.get_or_add_tcPr()
     
-    # Check for tag existance, if none found, then create one
+    # Build all requested edges as one XML fragment and parse it in a single call
+    edges = []
+    for edge in _CELL_BORDER_EDGES:
+        edge_data = kwargs.get(edge)
+        if edge_data:
+            attrs = ' '.join(
+                f'w:{key}="{edge_data[key]}"'
+                for key in _CELL_BORDER_ATTRS if key in edge_data
+            )
+            edges.append(f'<w:{edge} {attrs}/>')
+    new_borders = parse_xml(_CELL_BORDERS_TMPL.format(nsdecls=nsdecls('w'), edges=''.join(edges)))
+    
+    # Check for tag existance, if none found, then use the new block as is
     tcBorders = tcPr.first_child_found_in("w:tcBorders")
     if tcBorders is None:
-        tcBorders = OxmlElement('w:tcBorders')
-        tcPr.append(tcBorders)
+        tcPr.append(new_borders)
+        return
     
-    # List of valid border types
-    for edge in ('start', 'top', 'end', 'bottom', 'insideH', 'insideV'):
-        edge_data = kwargs.get(edge)
-        if edge_data:
-            tag = 'w:{}'.format(edge)
-            
-            # Check for tag existance, if none found, then create one
-            element = tcBorders.find(qn(tag))
-            if element is None:
-                element = OxmlElement(tag)
-                tcBorders.append(element)
-            
-            # Set border attributes
-            for key in ["sz", "val", "color", "space", "shadow"]:
-                if key in edge_data:
-                    element.set(qn('w:{}'.format(key)), str(edge_data[key]))
+    # Otherwise merge edge attributes into the existing block
+    appended = False
+    for element in list(new_borders):
+        existing = tcBorders.find(element.tag)
+        if existing is None:
+            tcBorders.append(element)
+            appended = True
+        else:
+            for key, value in element.attrib.items():
+                existing.set(key, value)
+    
+    # Word rejects out-of-order edges; tl2br/tr2bl stay last
+    if appended:
+        tcBorders[:] = sorted(tcBorders, key=lambda e: _CELL_BORDER_RANK.get(e.tag, len(_CELL_BORDER_RANK)))
 
 
 def set_repeat_table_header(row):
@@ -3,11 +3,20 @@ MOS (Military Occupational Specialty) mapping service.
 Loads and searches MOS codes from Excel file, translates them to civilian skills.
 """
 
+import heapq
 import pandas as pd
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple
+from dataclasses import dataclass, field
 from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    # Rust-backed reader; much faster than openpyxl on large sheets when available
+    import python_calamine  # noqa: F401
+    _EXCEL_ENGINE = 'calamine'
+except ImportError:
+    _EXCEL_ENGINE = 'openpyxl'
 
 try:
     from utils.config import settings
@@ -24,6 +33,41 @@ except ImportError:
         settings = MockSettings()
 
 
+# Accepted header spellings for each column we use (matched case-insensitively)
+_COLUMN_ALIASES: Dict[str, List[str]] = {
+    'branch_code': ['branch_code', 'Branch Code'],
+    'personnel_category': ['personnel_category', 'Personnel Category'],
+    'code': ['code', 'Code', 'MOS_CODE'],
+    'title_military': ['title_military', 'Title Military', 'title'],
+    'soc_code': ['soc_code', 'SOC Code'],
+    'soc_code_title': ['soc_code_title', 'SOC Code Title'],
+    'soc_title': ['soc_title', 'SOC Title'],
+    'onet_code': ['onet_code', 'O*NET Code', 'ONET Code'],
+    'onet_occupation': ['onet_occupation', 'O*NET Occupation', 'ONET Occupation'],
+    'csv_lookup_key': ['csv_lookup_key', 'CSV Lookup Key']
+}
+
+# Map branch codes to full names
+_BRANCH_MAP = MappingProxyType({
+    'A': 'Army', 'Army': 'Army',
+    'N': 'Navy', 'Navy': 'Navy',
+    'AF': 'Air Force', 'Air Force': 'Air Force',
+    'M': 'Marines', 'Marines': 'Marines',
+    'CG': 'Coast Guard', 'Coast Guard': 'Coast Guard',
+    'SF': 'Space Force', 'Space Force': 'Space Force',
+    'V': 'Navy',  # V codes are typically Navy
+})
+
+_ACCEPTED_HEADERS = frozenset(
+    name.lower() for names in _COLUMN_ALIASES.values() for name in names
+)
+
+
+def _is_accepted_header(column) -> bool:
+    """Column filter for the readers: keep only headers listed in _COLUMN_ALIASES."""
+    return str(column).strip().lower() in _ACCEPTED_HEADERS
+
+
 @dataclass
 class MOSMapping:
     """Represents a single MOS mapping entry with enhanced fields."""
@@ -43,26 +87,29 @@ class MOSMapping:
     civilian_equivalent: str = ""
     skills: List[str] = None
     keywords: List[str] = None
+    _search_blob: str = field(default='', init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.skills is None:
             self.skills = []
         if self.keywords is None:
             self.keywords = []
+        
+        # Lowercase all searchable text once so queries are a single substring check
+        self._search_blob = '\n'.join(filter(None, [
+            self.code,
+            self.title,
+            self.title_military,
+            self.civilian_equivalent,
+            self.soc_title,
+            self.onet_occupation,
+            *self.skills,
+            *self.keywords,
+        ])).lower()
     
     def matches_query(self, query: str) -> bool:
         """Check if this MOS matches a search query."""
-        query_lower = query.lower()
-        return (
-            query_lower in self.code.lower() or
-            query_lower in self.title.lower() or
-            (self.title_military and query_lower in self.title_military.lower()) or
-            (self.civilian_equivalent and query_lower in self.civilian_equivalent.lower()) or
-            (self.soc_title and query_lower in self.soc_title.lower()) or
-            (self.onet_occupation and query_lower in self.onet_occupation.lower()) or
-            any(query_lower in skill.lower() for skill in self.skills) or
-            any(query_lower in keyword.lower() for keyword in self.keywords)
-        )
+        return query.lower() in self._search_blob
 
 
 class MOSMappingService:
@@ -89,45 +136,46 @@ class MOSMappingService:
             else:
                 self.data_path = excel_file  # Default to Excel
         
-        self._mappings: Dict[str, MOSMapping] = {}
+        # Per-instance cache so typing the same prefix again is a dict hit
+        self._search_cached = lru_cache(maxsize=1024)(self._search)
         self._load_mappings()
     
     def _load_mappings(self) -> None:
         """Load MOS mappings from Excel or CSV file."""
+        # Each mapping is stored once; code and lookup key index into it.
+        # Reset here so a reload replaces the indexes instead of appending
+        self._entries: List[MOSMapping] = []
+        self._by_code: Dict[str, int] = {}
+        self._by_key: Dict[str, int] = {}
+        # Columns parallel to _entries, scanned directly by _search
+        self._codes: List[str] = []
+        self._titles_lower: List[str] = []
+        self._blobs: List[str] = []
+        self._all_codes: Tuple[str, ...] = ()
+        self._search_cached.cache_clear()
+        
         if not self.data_path.exists():
             if logger:
                 logger.warning(f"MOS mapping file not found: {self.data_path}")
             return
         
         try:
-            # Load data based on file extension
+            # Load only the columns we use, as plain strings with empty cells as ''
+            read_options = {
+                'usecols': _is_accepted_header,
+                'dtype': str,
+                'na_filter': False,
+            }
             if self.data_path.suffix == '.xlsx':
-                df = pd.read_excel(self.data_path, engine='openpyxl')
+                df = pd.read_excel(self.data_path, engine=_EXCEL_ENGINE, **read_options)
             else:
-                df = pd.read_csv(self.data_path)
-            
-            # Clean column names - strip whitespace and handle case variations
-            df.columns = df.columns.str.strip()
-            
-            # Expected columns from the Excel file
-            required_cols = {
-                'branch_code': ['branch_code', 'Branch Code'],
-                'personnel_category': ['personnel_category', 'Personnel Category'],
-                'code': ['code', 'Code', 'MOS_CODE'],
-                'title_military': ['title_military', 'Title Military', 'title'],
-                'soc_code': ['soc_code', 'SOC Code'],
-                'soc_code_title': ['soc_code_title', 'SOC Code Title'],
-                'soc_title': ['soc_title', 'SOC Title'],
-                'onet_code': ['onet_code', 'O*NET Code', 'ONET Code'],
-                'onet_occupation': ['onet_occupation', 'O*NET Occupation', 'ONET Occupation'],
-                'csv_lookup_key': ['csv_lookup_key', 'CSV Lookup Key']
-            }
+                df = pd.read_csv(self.data_path, **read_options)
             
-            # Map column names (case-insensitive)
+            # Map column names (case-insensitive, ignoring surrounding whitespace)
             col_mapping = {}
-            df_cols_lower = {col.lower(): col for col in df.columns}
+            df_cols_lower = {str(col).strip().lower(): col for col in df.columns}
             
-            for target_col, possible_names in required_cols.items():
+            for target_col, possible_names in _COLUMN_ALIASES.items():
                 for name in possible_names:
                     if name.lower() in df_cols_lower:
                         col_mapping[df_cols_lower[name.lower()]] = target_col
@@ -135,40 +183,31 @@ class MOSMappingService:
             
             # Rename columns
             df = df.rename(columns=col_mapping)
+            for target_col in _COLUMN_ALIASES:
+                if target_col not in df.columns:
+                    df[target_col] = ''
             
-            # Fill NaN values with empty strings
-            df = df.fillna('')
+            # Resolve branches for all rows at once: the branch part of
+            # csv_lookup_key wins, then branch_code, then 'Unknown'
+            lookup_col = df['csv_lookup_key']
+            branch_code_col = df['branch_code']
+            has_pipe = lookup_col.str.contains('|', regex=False)
+            branch_part = lookup_col.str.partition('|')[0].str.strip()
+            branches = (
+                branch_part.map(_BRANCH_MAP).fillna(branch_part)
+                .where(has_pipe, branch_code_col.map(_BRANCH_MAP).fillna(branch_code_col))
+                .where(has_pipe | (branch_code_col != ''), 'Unknown')
+                .to_numpy()
+            )
             
             # Process each row
-            for _, row in df.iterrows():
+            for (_, row), branch in zip(df.iterrows(), branches):
                 code = str(row.get('code', '')).strip().upper()
                 
                 if not code:
                     continue
                 
-                # Extract branch from csv_lookup_key or branch_code
                 lookup_key = str(row.get('csv_lookup_key', ''))
-                branch_code = str(row.get('branch_code', ''))
-                
-                # Map branch codes to full names
-                branch_map = {
-                    'A': 'Army', 'Army': 'Army',
-                    'N': 'Navy', 'Navy': 'Navy',
-                    'AF': 'Air Force', 'Air Force': 'Air Force',
-                    'M': 'Marines', 'Marines': 'Marines',
-                    'CG': 'Coast Guard', 'Coast Guard': 'Coast Guard',
-                    'SF': 'Space Force', 'Space Force': 'Space Force',
-                    'V': 'Navy',  # V codes are typically Navy
-                }
-                
-                # Determine branch
-                if lookup_key and '|' in lookup_key:
-                    branch_part = lookup_key.split('|')[0].strip()
-                    branch = branch_map.get(branch_part, branch_part)
-                elif branch_code:
-                    branch = branch_map.get(branch_code, branch_code)
-                else:
-                    branch = 'Unknown'
                 
                 # Build civilian equivalent from SOC and O*NET titles
                 soc_title = str(row.get('soc_title', '')).strip()
@@ -205,13 +244,20 @@ class MOSMappingService:
                     keywords=keywords if keywords else []
                 )
                 
-                # Store by code and by lookup key
-                self._mappings[code] = mapping
+                # Store once, indexed by code and by lookup key
+                idx = len(self._entries)
+                self._entries.append(mapping)
+                self._by_code[code] = idx
                 if lookup_key:
-                    self._mappings[lookup_key] = mapping
+                    self._by_key[lookup_key] = idx
+            
+            self._codes = [m.code for m in self._entries]
+            self._titles_lower = [m.title.lower() for m in self._entries]
+            self._blobs = [m._search_blob for m in self._entries]
+            self._all_codes = tuple(sorted(self._by_code.keys() | self._by_key.keys()))
             
             if logger:
-                logger.info(f"Loaded {len(self._mappings)} MOS mappings from {self.data_path.name}")
+                logger.info(f"Loaded {len(self._entries)} MOS mappings from {self.data_path.name}")
         
         except Exception as e:
             if logger:
@@ -232,20 +278,23 @@ class MOSMappingService:
         if not query or len(query) < 2:
             return []
         
-        matches = [
-            mapping for mapping in self._mappings.values()
-            if mapping.matches_query(query)
-        ]
+        return list(self._search_cached(query.lower(), limit))
+    
+    def _search(self, query_lower: str, limit: int) -> Tuple[MOSMapping, ...]:
+        """Uncached search backing search_mos; takes an already-lowercased query."""
+        hits = [i for i, blob in enumerate(self._blobs) if query_lower in blob]
         
-        # Sort by relevance (exact code match first, then title match)
-        query_upper = query.upper()
-        matches.sort(key=lambda m: (
-            0 if m.code == query_upper else 1,
-            0 if query.lower() in m.title.lower() else 1,
-            m.code
+        # Rank by relevance (exact code match first, then title match, then code)
+        query_upper = query_lower.upper()
+        codes = self._codes
+        titles = self._titles_lower
+        top = heapq.nsmallest(limit, hits, key=lambda i: (
+            codes[i] != query_upper,
+            query_lower not in titles[i],
+            codes[i]
         ))
         
-        return matches[:limit]
+        return tuple(self._entries[i] for i in top)
     
     def get_mos(self, code: str) -> Optional[MOSMapping]:
         """
@@ -257,7 +306,11 @@ class MOSMappingService:
         Returns:
             MOSMapping if found, None otherwise
         """
-        return self._mappings.get(code.upper())
+        key = code.upper()
+        idx = self._by_code.get(key)
+        if idx is None:
+            idx = self._by_key.get(key)
+        return self._entries[idx] if idx is not None else None
     
     def skills_for(self, code: str) -> List[str]:
         """
@@ -272,9 +325,9 @@ class MOSMappingService:
         mapping = self.get_mos(code)
         return mapping.skills if mapping else []
     
-    def get_all_codes(self) -> List[str]:
-        """Get all available MOS codes."""
-        return sorted(self._mappings.keys())
+    def get_all_codes(self) -> Tuple[str, ...]:
+        """Get all available MOS codes (sorted once at load time)."""
+        return self._all_codes
     
     def get_by_branch(self, branch: str) -> List[MOSMapping]:
         """
@@ -287,7 +340,7 @@ class MOSMappingService:
             List of MOS mappings for that branch
         """
         return [
-            mapping for mapping in self._mappings.values()
+            mapping for mapping in self._entries
             if mapping.branch.lower() == branch.lower()
         ]
 
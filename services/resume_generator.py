@@ -3,9 +3,15 @@ DOCX Resume Generator using python-docx.
 Creates professional resumes with precise layout control.
 """
 
+import io
+from itertools import chain
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
 from docx import Document
+from docx.shared import Inches, Pt
+from docx.enum.style import WD_STYLE_TYPE
 
 from models import ResumeProfile
 from services.docx_utils import (
@@ -21,13 +27,121 @@ from services.docx_utils import (
     add_education_certification_combined_table,
     add_certification_entry,
     add_certification_section_table,
-    add_volunteer_entry,
-    add_skills_section
+    add_volunteer_section,
+    add_skills_section,
+    append_paragraph
 )
+from utils.formatting import format_location
 from utils.logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Full branch names used in the title line
+_BRANCH_MAP = MappingProxyType({
+    'Army': 'UNITED STATES ARMY',
+    'Navy': 'UNITED STATES NAVY',
+    'Marines': 'UNITED STATES MARINE CORPS',
+    'Marine Corps': 'UNITED STATES MARINE CORPS',
+    'Air Force': 'UNITED STATES AIR FORCE',
+    'Space Force': 'UNITED STATES SPACE FORCE',
+    'Coast Guard': 'UNITED STATES COAST GUARD'
+})
+
+# Hanging-indent bullet formatting for awards and volunteer lines
+_BULLET_INDENT = Inches(0.25)
+_NEG_INDENT = Inches(-0.25)
+_BULLET_SPACE = Pt(2)
+_BULLET_SIZE = Pt(10)
+_BULLET_STYLE = 'BulletCalibriLight'
+
+
+@lru_cache(maxsize=32)
+def _resolve_branch(branch: str) -> str:
+    """Full upper-case branch name for the title line."""
+    return _BRANCH_MAP.get(branch) or branch.upper()
+
+
+@lru_cache(maxsize=1)
+def _base_document_bytes() -> bytes:
+    """Serialized blank document, built once and reused as the starting point for every resume."""
+    buf = io.BytesIO()
+    Document().save(buf)
+    return buf.getvalue()
+
+
+def _ensure_bullet_style(doc: Document):
+    """Return the shared bullet paragraph style, adding it to the document on first use."""
+    styles = doc.styles
+    try:
+        return styles[_BULLET_STYLE]
+    except KeyError:
+        pass
+    style = styles.add_style(_BULLET_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    style.base_style = styles['Normal']
+    style.font.name = 'Calibri Light'
+    style.font.size = _BULLET_SIZE
+    style.paragraph_format.left_indent = _BULLET_INDENT
+    style.paragraph_format.first_line_indent = _NEG_INDENT
+    style.paragraph_format.space_after = _BULLET_SPACE
+    return style
+
+
+def _edu_to_dict(edu) -> Dict[str, Any]:
+    """Flatten an Education entry into the dict used by the education table."""
+    # Use date_range if available, otherwise use graduation_year
+    grad_info = ""
+    date_range = getattr(edu, 'date_range', None)
+    if date_range:
+        grad_info = date_range
+    elif edu.in_progress:
+        grad_info = "In Progress"
+    elif edu.graduation_year:
+        grad_info = str(edu.graduation_year)
+    
+    # Get location for education
+    edu_location = ""
+    if hasattr(edu, 'city') and hasattr(edu, 'state'):
+        edu_location = format_location(edu.city, edu.state)
+    elif hasattr(edu, 'location'):
+        edu_location = edu.location
+    
+    return {
+        'degree': edu.degree,
+        'institution': edu.institution,
+        'location': edu_location,
+        'graduation': grad_info,
+        'gpa': f"GPA: {edu.gpa:.2f}" if edu.gpa else None,
+        'honors': ', '.join(edu.honors) if edu.honors else None,
+        'overview': edu.overview,
+        'courses_overview': getattr(edu, 'courses_overview', None),
+        'courses': getattr(edu, 'courses', None)
+    }
+
+
+def _cert_to_dict(cert) -> Dict[str, Any]:
+    """Flatten a Certification entry into the dict used by the certification tables."""
+    return {
+        'name': cert.name,
+        'issuer': cert.issuer
+    }
+
+
+def _vol_to_dict(vol) -> Optional[Dict[str, Any]]:
+    """
+    Flatten a volunteer entry (JSON dict or VolunteerExperience) into the dict
+    used by the volunteer table. Returns None for plain-text entries.
+    """
+    if isinstance(vol, str):
+        return None
+    get = vol.get if isinstance(vol, dict) else partial(getattr, vol)
+    return {
+        'role': get('role', 'Volunteer'),
+        'organization': get('organization', ''),
+        'location': get('location', ''),
+        'date_range': get('date_range', ''),
+        'description': get('description', None)
+    }
+
 
 class DocxResumeGenerator:
     """
@@ -50,10 +164,26 @@ class DocxResumeGenerator:
         Returns:
             Path to generated DOCX file
         """
+        # Package in memory, then hit the filesystem with a single write
+        Path(output_path).write_bytes(self.generate_bytes(profile))
+        logger.info(f"Resume saved to {output_path}")
+        
+        return output_path
+    
+    def generate_bytes(self, profile: ResumeProfile) -> bytes:
+        """
+        Generate a resume DOCX in memory.
+        
+        Args:
+            profile: Resume profile data
+        
+        Returns:
+            DOCX file contents
+        """
         logger.info(f"Generating resume for {profile.contact.full_name}")
         
-        # Create new document
-        doc = Document()
+        # Create new document from the cached blank template
+        doc = Document(io.BytesIO(_base_document_bytes()))
         
         # Set page margins
         set_page_margins(doc, top=0.5, bottom=0.5, left=0.7, right=0.7)
@@ -83,15 +213,13 @@ class DocxResumeGenerator:
         # Add additional sections if present (volunteer, awards, etc.)
         self._add_additional_sections(doc, profile)
         
-        # Save document
-        doc.save(output_path)
-        logger.info(f"Resume saved to {output_path}")
-        
-        return output_path
+        buf = io.BytesIO()
+        doc.save(buf)
+        return buf.getvalue()
     
     def _add_contact_section(self, doc: Document, profile: ResumeProfile) -> None:
         """Add contact information header."""
-        location = self._format_location(profile.contact.city, profile.contact.state)
+        location = format_location(profile.contact.city, profile.contact.state)
         
         add_contact_header(
             doc,
@@ -105,27 +233,17 @@ class DocxResumeGenerator:
     
     def _add_branch_section(self, doc: Document, profile: ResumeProfile) -> None:
         """Add military branch title section."""
-        branch = profile.contact.branch if hasattr(profile.contact, 'branch') and profile.contact.branch else None
+        branch = getattr(profile.contact, 'branch', None) or None
         mos_code = profile.mos.code if profile.mos else ''
         mos_title = profile.mos.title if profile.mos else ''
         
         # Format branch name with "UNITED STATES" prefix
-        branch_map = {
-            'Army': 'UNITED STATES ARMY',
-            'Navy': 'UNITED STATES NAVY',
-            'Marines': 'UNITED STATES MARINE CORPS',
-            'Marine Corps': 'UNITED STATES MARINE CORPS',
-            'Air Force': 'UNITED STATES AIR FORCE',
-            'Space Force': 'UNITED STATES SPACE FORCE',
-            'Coast Guard': 'UNITED STATES COAST GUARD'
-        }
-        
         if branch and mos_title:
-            full_branch = branch_map.get(branch, branch.upper())
+            full_branch = _resolve_branch(branch)
             branch_title = f"{full_branch} - {mos_title.upper()}"
             add_branch_title(doc, branch_title)
         elif branch:
-            full_branch = branch_map.get(branch, branch.upper())
+            full_branch = _resolve_branch(branch)
             branch_title = f"{full_branch} VETERAN"
             add_branch_title(doc, branch_title)
     
@@ -133,19 +251,15 @@ class DocxResumeGenerator:
         """Add work experience section."""
         add_heading_with_line(doc, "PROFESSIONAL EXPERIENCE")
         
-        # Prepare all experience entries
-        experiences = []
-        for exp in profile.work_history:
-            # Use AI-generated bullets if available, otherwise use original bullets
-            bullets = exp.ai_generated_bullets if exp.ai_generated_bullets else exp.achievements
-            
-            experiences.append({
-                'title': exp.job_title,
-                'subtitle': exp.employer,
-                'location': exp.location or '',
-                'date_range': exp.date_range,
-                'bullets': bullets
-            })
+        # Prepare all experience entries (the table builder needs len(), so keep a list).
+        # Use AI-generated bullets if available, otherwise use original bullets.
+        experiences = [{
+            'title': exp.job_title,
+            'subtitle': exp.employer,
+            'location': exp.location or '',
+            'date_range': exp.date_range,
+            'bullets': exp.ai_generated_bullets or exp.achievements
+        } for exp in profile.work_history]
         
         # Add all experiences in a single table with shared outer border
         add_experience_section_table(doc, experiences)
@@ -154,48 +268,9 @@ class DocxResumeGenerator:
         """Add combined education and certifications section."""
         add_heading_with_line(doc, "EDUCATION & CERTIFICATIONS")
         
-        # Prepare all education entries
-        education_list = []
-        for edu in profile.education:
-            # Use date_range if available, otherwise use graduation_year
-            grad_info = ""
-            if hasattr(edu, 'date_range') and edu.date_range:
-                grad_info = edu.date_range
-            elif edu.in_progress:
-                grad_info = "In Progress"
-            elif edu.graduation_year:
-                grad_info = str(edu.graduation_year)
-            
-            # Get location for education
-            edu_location = ""
-            if hasattr(edu, 'city') and hasattr(edu, 'state'):
-                edu_location = self._format_location(edu.city, edu.state)
-            elif hasattr(edu, 'location'):
-                edu_location = edu.location
-            
-            # Format GPA and honors
-            gpa_str = f"GPA: {edu.gpa:.2f}" if edu.gpa else None
-            honors_str = ', '.join(edu.honors) if edu.honors else None
-            
-            education_list.append({
-                'degree': edu.degree,
-                'institution': edu.institution,
-                'location': edu_location,
-                'graduation': grad_info,
-                'gpa': gpa_str,
-                'honors': honors_str,
-                'overview': edu.overview,
-                'courses_overview': getattr(edu, 'courses_overview', None),
-                'courses': getattr(edu, 'courses', None)
-            })
-        
-        # Prepare all certification entries (no date field)
-        certifications = []
-        for cert in profile.certifications:
-            certifications.append({
-                'name': cert.name,
-                'issuer': cert.issuer
-            })
+        education_list = [_edu_to_dict(edu) for edu in profile.education]
+        # Certifications have no date field
+        certifications = [_cert_to_dict(cert) for cert in profile.certifications]
         
         # Add both education and certifications in a single table with shared outer border
         add_education_certification_combined_table(doc, education_list, certifications)
@@ -205,47 +280,29 @@ class DocxResumeGenerator:
         add_heading_with_line(doc, "CERTIFICATIONS")
         
         # Prepare all certification entries
-        certifications = []
-        for cert in profile.certifications:
-            certifications.append({
-                'name': cert.name,
-                'issuer': cert.issuer
-            })
+        certifications = [_cert_to_dict(cert) for cert in profile.certifications]
         
         # Add certifications in a table (two per row)
         add_certification_section_table(doc, certifications)
     
     def _add_skills_section(self, doc: Document, profile: ResumeProfile) -> None:
         """Add skills section."""
-        skills_list = []
-        
-        # Add MOS-translated skills first (most relevant)
-        if hasattr(profile, 'mos_translated_skills') and profile.mos_translated_skills:
-            skills_list.extend(profile.mos_translated_skills)
-        
-        # Add core skills
-        if hasattr(profile, 'core_skills') and profile.core_skills:
-            for skill in profile.core_skills:
-                if skill not in skills_list:
-                    skills_list.append(skill)
-        
-        # Add tools and technologies
-        if hasattr(profile, 'tools_technologies') and profile.tools_technologies:
-            for skill in profile.tools_technologies:
-                if skill not in skills_list:
-                    skills_list.append(skill)
-        
-        # Add target keywords for ATS
-        if hasattr(profile, 'target_keywords') and profile.target_keywords:
-            for skill in profile.target_keywords:
-                if skill not in skills_list:
-                    skills_list.append(skill)
+        # MOS-translated skills first (most relevant), then core skills, tools,
+        # ATS keywords and MOS civilian skills
+        sources = (
+            getattr(profile, 'mos_translated_skills', None) or (),
+            getattr(profile, 'core_skills', None) or (),
+            getattr(profile, 'tools_technologies', None) or (),
+            getattr(profile, 'target_keywords', None) or (),
+            (getattr(profile.mos, 'civilian_skills', None) or ()) if profile.mos else (),
+        )
         
-        # Add MOS civilian skills if available
-        if profile.mos and hasattr(profile.mos, 'civilian_skills') and profile.mos.civilian_skills:
-            for skill in profile.mos.civilian_skills:
-                if skill not in skills_list:
-                    skills_list.append(skill)
+        # Case-insensitive dedup in one pass; the first spelling seen wins
+        unique = {}
+        for skill in chain.from_iterable(sources):
+            unique.setdefault(skill.strip().lower(), skill)
+        unique.pop('', None)
+        skills_list = list(unique.values())
         
         # Format skills as comma-separated text
         if skills_list:
@@ -260,71 +317,28 @@ class DocxResumeGenerator:
         # Add awards if present
         if profile.additional_info.awards and len(profile.additional_info.awards) > 0:
             add_heading_with_line(doc, "AWARDS & HONORS")
+            bullet_style = _ensure_bullet_style(doc)
             for award in profile.additional_info.awards:
-                para = doc.add_paragraph(f"• {award}")
-                para.paragraph_format.left_indent = Inches(0.25)
-                para.paragraph_format.first_line_indent = Inches(-0.25)
-                para.paragraph_format.space_after = Pt(2)
-                for run in para.runs:
-                    run.font.size = Pt(10)
-                    run.font.name = 'Calibri Light'
+                para = append_paragraph(doc, f"• {award}")
+                para.style = bullet_style
         
         # Add volunteer experience if present
         if profile.additional_info.volunteer and len(profile.additional_info.volunteer) > 0:
             add_heading_with_line(doc, "VOLUNTEER EXPERIENCE")
+            # Consecutive detailed entries share one table
+            entries = []
+            bullet_style = None
             for vol in profile.additional_info.volunteer:
-                if isinstance(vol, str):
-                    # Handle simple string format
-                    para = doc.add_paragraph(f"• {vol}")
-                    para.paragraph_format.left_indent = Inches(0.25)
-                    para.paragraph_format.first_line_indent = Inches(-0.25)
-                    para.paragraph_format.space_after = Pt(2)
-                    for run in para.runs:
-                        run.font.size = Pt(10)
-                        run.font.name = 'Calibri Light'
-                elif isinstance(vol, dict):
-                    # Handle dict format from JSON
-                    role = vol.get('role', 'Volunteer')
-                    organization = vol.get('organization', '')
-                    location = vol.get('location', '')
-                    date_range = vol.get('date_range', '')
-                    description = vol.get('description', None)
-                    
-                    add_volunteer_entry(
-                        doc,
-                        role=role,
-                        organization=organization,
-                        location=location,
-                        date_range=date_range,
-                        description=description
-                    )
-                else:
-                    # Handle VolunteerExperience object
-                    role = getattr(vol, 'role', 'Volunteer')
-                    organization = getattr(vol, 'organization', '')
-                    location = getattr(vol, 'location', '')
-                    date_range = getattr(vol, 'date_range', '')
-                    description = getattr(vol, 'description', None)
-                    
-                    add_volunteer_entry(
-                        doc,
-                        role=role,
-                        organization=organization,
-                        location=location,
-                        date_range=date_range,
-                        description=description
-                    )
-    
-    def _format_location(self, city: Optional[str], state: Optional[str]) -> str:
-        """Format city and state for display."""
-        if city and state:
-            return f"{city}, {state}"
-        elif city:
-            return city
-        elif state:
-            return state
-        return ''
-
-
-# Import needed for docx_utils
-from docx.shared import Inches, Pt
+                entry = _vol_to_dict(vol)
+                if entry is not None:
+                    entries.append(entry)
+                    continue
+                
+                # Plain-text entry: flush the pending table, then add a bullet
+                add_volunteer_section(doc, entries)
+                entries = []
+                if bullet_style is None:
+                    bullet_style = _ensure_bullet_style(doc)
+                para = append_paragraph(doc, f"• {vol}")
+                para.style = bullet_style
+            add_volunteer_section(doc, entries)
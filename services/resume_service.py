@@ -4,17 +4,29 @@ Handles document generation with precise layout control.
 """
 
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 
 from models import ResumeProfile
 from utils.config import settings
 from utils.logging_utils import get_logger
-from services.resume_generator import DocxResumeGenerator
 
 logger = get_logger(__name__)
 
+# Compiled once; used on every resume generation
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+
+def _generate_one(job: Tuple[ResumeProfile, Path]) -> Path:
+    """Worker for generate_many; module-level so it can be pickled."""
+    from services.resume_generator import DocxResumeGenerator
+    
+    profile, output_path = job
+    return DocxResumeGenerator().generate(profile, output_path)
+
 
 class ResumeService:
     """Service for generating resume documents."""
@@ -30,12 +42,20 @@ class ResumeService:
         self.template_dir = template_dir or settings.template_dir
         self.output_dir = output_dir or settings.output_dir
         
-        # Initialize the DOCX generator
-        self.generator = DocxResumeGenerator()
+        # DOCX generator is created on first use (see the generator property)
+        self._generator = None
         
         # Ensure directories exist
         self.output_dir.mkdir(exist_ok=True, parents=True)
     
+    @property
+    def generator(self):
+        """DOCX generator; python-docx and lxml are only imported on first access."""
+        if self._generator is None:
+            from services.resume_generator import DocxResumeGenerator
+            self._generator = DocxResumeGenerator()
+        return self._generator
+    
     def generate_resume(
         self,
         profile: ResumeProfile,
@@ -69,6 +89,44 @@ class ResumeService:
         
         return output_path
     
+    def generate_many(
+        self,
+        profiles: List[ResumeProfile],
+        max_workers: Optional[int] = None
+    ) -> List[Path]:
+        """
+        Generate resumes for several profiles in parallel worker processes.
+        
+        Args:
+            profiles: Resume profiles to generate
+            max_workers: Worker process count (defaults to CPU count)
+        
+        Returns:
+            Paths to generated DOCX files, in the order of profiles
+        """
+        # Filenames are resolved here so output_dir is only touched by the parent.
+        # Same-name profiles in one batch share a timestamp, so later ones get
+        # a numeric suffix instead of overwriting the first file.
+        jobs = []
+        name_counts: Dict[str, int] = {}
+        for profile in profiles:
+            filename = self._generate_filename(profile)
+            count = name_counts.get(filename, 0) + 1
+            name_counts[filename] = count
+            if count > 1:
+                filename = f"{filename[:-len('.docx')]}_{count}.docx"
+            jobs.append((profile, self.output_dir / filename))
+        
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                paths = list(executor.map(_generate_one, jobs))
+        except Exception as e:
+            logger.error(f"Batch resume generation failed: {e}")
+            raise Exception(f"Failed to generate resumes: {e}")
+        
+        logger.info(f"Generated {len(paths)} resumes in {self.output_dir}")
+        return paths
+    
     def _normalize_whitespace(self, text: str) -> str:
         """
         Normalize whitespace in text.
@@ -79,21 +137,15 @@ class ResumeService:
         Returns:
             Text with normalized whitespace
         """
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        return text
+        # str.split() drops leading/trailing whitespace and splits on the same
+        # characters as \s, so this collapses runs without touching the regex engine
+        return ' '.join(text.split())
     
-    def _format_location(self, city: Optional[str], state: Optional[str]) -> str:
-        """Format city and state for display."""
-        if city and state:
-            return f"{city}, {state}"
-        elif city:
-            return city
-        elif state:
-            return state
-        return ''
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _slug(full_name: str) -> str:
+        """Filename-safe form of a name (cached; only the timestamp changes per call)."""
+        return _SLUG_RE.sub('_', full_name.lower()).strip('_')
     
     def _generate_filename(self, profile: ResumeProfile) -> str:
         """
@@ -106,9 +158,7 @@ class ResumeService:
             Filename for the resume
         """
         # Sanitize name for filename
-        name = profile.contact.full_name.lower()
-        name = re.sub(r'[^a-z0-9]+', '_', name)
-        name = name.strip('_')
+        name = self._slug(profile.contact.full_name)
         
         # Add timestamp for uniqueness
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
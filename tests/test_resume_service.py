@@ -0,0 +1,50 @@
+"""
+Tests for batch resume generation in ResumeService.
+"""
+
+from docx import Document
+
+from models import Contact, ResumeProfile
+from services.resume_service import ResumeService
+
+
+def _profile(email: str, summary: str) -> ResumeProfile:
+    return ResumeProfile(
+        contact=Contact(
+            full_name='Jane Doe',
+            email=email,
+            phone='555-123-4567',
+            city='Austin',
+            state='TX',
+        ),
+        target_roles=['Operations Manager'],
+        summary=summary,
+    )
+
+
+def _document_text(path) -> str:
+    return '\n'.join(para.text for para in Document(path).paragraphs)
+
+
+def test_generate_many_keeps_same_name_profiles_apart(tmp_path):
+    service = ResumeService(output_dir=tmp_path)
+    profiles = [
+        _profile('jane.first@example.com', 'First profile summary.'),
+        _profile('jane.second@example.com', 'Second profile summary.'),
+    ]
+
+    paths = service.generate_many(profiles, max_workers=2)
+
+    assert len(paths) == 2
+    assert len(set(paths)) == 2
+    assert sorted(tmp_path.glob('*.docx')) == sorted(paths)
+    for path in paths:
+        assert path.parent == tmp_path
+        assert path.name.startswith('resume_jane_doe_')
+
+    # Each file holds its own profile, in the order the profiles were given
+    first, second = (_document_text(path) for path in paths)
+    assert 'First profile summary.' in first
+    assert 'Second profile summary.' not in first
+    assert 'Second profile summary.' in second
+    assert 'First profile summary.' not in second
@@ -2,15 +2,44 @@
 Configuration management for the Resume Builder application.
 """
 
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
+from utils.logging_utils import get_logger
+
 # Load .env file explicitly
 load_dotenv()
 
+logger = get_logger(__name__)
+if os.getenv("CONFIG_DEBUG"):
+    logger.setLevel(logging.DEBUG)
+
+# Resolve st.secrets once per process; plain dict when streamlit is unavailable
+try:
+    import streamlit as _st
+    _SECRETS = _st.secrets
+except Exception:
+    _SECRETS = {}
+
+
+def _to_bool(value) -> bool:
+    """Interpret an env/secrets value as a boolean flag."""
+    return str(value).lower() == "true"
+
+
+# (env/secrets key, Settings attribute, cast) for values overridable at startup
+_OVERRIDES = (
+    ("AI_MODEL", "ai_model", str),
+    ("LOG_LEVEL", "log_level", str),
+    ("REDACT_PII", "redact_pii", _to_bool),
+    ("OPENAI_API_KEY", "openai_api_key", str),
+)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -52,81 +81,52 @@ class Settings(BaseSettings):
         self.template_dir.mkdir(exist_ok=True, parents=True)
         self.data_dir.mkdir(exist_ok=True)
 
-        import os
-        try:
-            import streamlit as _st
-            _secrets = _st.secrets
-        except Exception:
-            _secrets = {}
-
         # Track source for each config
         config_sources = {}
 
-        # AI_MODEL
-        env_ai_model = os.getenv("AI_MODEL") or os.getenv("ai_model")
-        if env_ai_model:
-            self.ai_model = str(env_ai_model)
-            config_sources['AI_MODEL'] = f"env:AI_MODEL"
-        elif "AI_MODEL" in _secrets or "ai_model" in _secrets:
-            self.ai_model = str(_secrets["AI_MODEL"] if "AI_MODEL" in _secrets else _secrets["ai_model"])
-            config_sources['AI_MODEL'] = f"st.secrets:AI_MODEL"
-        else:
-            config_sources['AI_MODEL'] = ".env or default"
-
-        # LOG_LEVEL
-        env_log_level = os.getenv("LOG_LEVEL") or os.getenv("log_level")
-        if env_log_level:
-            self.log_level = str(env_log_level)
-            config_sources['LOG_LEVEL'] = f"env:LOG_LEVEL"
-        elif "LOG_LEVEL" in _secrets or "log_level" in _secrets:
-            self.log_level = str(_secrets["LOG_LEVEL"] if "LOG_LEVEL" in _secrets else _secrets["log_level"])
-            config_sources['LOG_LEVEL'] = f"st.secrets:LOG_LEVEL"
-        else:
-            config_sources['LOG_LEVEL'] = ".env or default"
-
-        # REDACT_PII
-        env_redact = os.getenv("REDACT_PII")
-        if env_redact is not None:
-            try:
-                self.redact_pii = str(env_redact).lower() == "true"
-            except Exception:
-                self.redact_pii = False
-            config_sources['REDACT_PII'] = f"env:REDACT_PII"
-        elif "REDACT_PII" in _secrets or "redact_pii" in _secrets:
-            try:
-                self.redact_pii = str(_secrets["REDACT_PII"] if "REDACT_PII" in _secrets else _secrets["redact_pii"]).lower() == "true"
-            except Exception:
-                self.redact_pii = False
-            config_sources['REDACT_PII'] = f"st.secrets:REDACT_PII"
-        else:
-            config_sources['REDACT_PII'] = ".env or default"
-
-        # OPENAI_API_KEY
-        env_openai_key = os.getenv("OPENAI_API_KEY") or os.getenv("openai_api_key")
-        if env_openai_key:
-            self.openai_api_key = str(env_openai_key)
-            config_sources['OPENAI_API_KEY'] = f"env:OPENAI_API_KEY"
-        elif "OPENAI_API_KEY" in _secrets or "openai_api_key" in _secrets:
-            self.openai_api_key = str(_secrets["OPENAI_API_KEY"] if "OPENAI_API_KEY" in _secrets else _secrets["openai_api_key"])
-            config_sources['OPENAI_API_KEY'] = f"st.secrets:OPENAI_API_KEY"
-        else:
-            config_sources['OPENAI_API_KEY'] = ".env or default"
-
-        # Debug: Show loaded configuration for startup logs (Streamlit captures stdout/stderr)
-        print(f"\n[Config] Loaded settings (env/st.secrets aware):")
-        print(f"  - AI_PROVIDER: {self.ai_provider}")
-        print(f"  - AI_MODEL: {self.ai_model}   [source: {config_sources['AI_MODEL']}]")
-        print(f"  - LOG_LEVEL: {self.log_level} [source: {config_sources['LOG_LEVEL']}]")
-        print(f"  - REDACT_PII: {self.redact_pii} [source: {config_sources['REDACT_PII']}]")
-        print(f"  - OPENAI_API_KEY: {'***' + self.openai_api_key[-8:] if self.openai_api_key else 'NOT SET'} [source: {config_sources['OPENAI_API_KEY']}]\n")
+        # Environment wins over st.secrets; both accept upper- or lower-case keys
+        for env_key, attr, cast in _OVERRIDES:
+            value = os.getenv(env_key) or os.getenv(attr)
+            if value:
+                source = f"env:{env_key}"
+            elif env_key in _SECRETS or attr in _SECRETS:
+                value = _SECRETS[env_key] if env_key in _SECRETS else _SECRETS[attr]
+                source = f"st.secrets:{env_key}"
+            else:
+                config_sources[env_key] = ".env or default"
+                continue
+            setattr(self, attr, cast(value))
+            config_sources[env_key] = source
+
+        # Debug: Show loaded configuration for startup logs (set CONFIG_DEBUG to enable)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Loaded settings (env/st.secrets aware):")
+            logger.debug("  - AI_PROVIDER: %s", self.ai_provider)
+            logger.debug("  - AI_MODEL: %s [source: %s]", self.ai_model, config_sources['AI_MODEL'])
+            logger.debug("  - LOG_LEVEL: %s [source: %s]", self.log_level, config_sources['LOG_LEVEL'])
+            logger.debug("  - REDACT_PII: %s [source: %s]", self.redact_pii, config_sources['REDACT_PII'])
+            logger.debug(
+                "  - OPENAI_API_KEY: %s [source: %s]",
+                '***' + self.openai_api_key[-8:] if self.openai_api_key else 'NOT SET',
+                config_sources['OPENAI_API_KEY']
+            )
 
         # Validate OpenAI configuration
         if self.ai_provider == "openai" and not self.openai_api_key:
-            print("⚠️  WARNING: OpenAI provider selected but no API key found. Falling back to mock provider.")
+            logger.warning("OpenAI provider selected but no API key found. Falling back to mock provider.")
             self.ai_provider = "mock"
         elif self.ai_provider == "openai" and self.openai_api_key:
-            print(f"✓ OpenAI configuration validated")
+            logger.info("OpenAI configuration validated")
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, constructing it on first use."""
+    return Settings()
 
 
-# Global settings instance
-settings = Settings()
+def __getattr__(name: str):
+    """Resolve the global ``settings`` instance on first access, not at import."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,34 +4,140 @@ Simple script to configure OpenAI API key for the resume builder.
 """
 
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+__all__ = ['configure_openai']
+
+# Settings looked up in the environment and Streamlit secrets (either case)
+_CONFIG_KEYS = ('OPENAI_API_KEY', 'AI_PROVIDER', 'AI_MODEL')
+
+# Seconds to wait for the OpenAI connection test
+_CONNECTION_TEST_TIMEOUT = 5.0
+
+# Values assumed for keys missing from .env
+_ENV_DEFAULTS = {
+    'OPENAI_API_KEY': 'your_openai_api_key_here',
+    'AI_PROVIDER': 'mock',
+    'AI_MODEL': 'gpt-4o-mini',
+    'LOG_LEVEL': 'INFO',
+    'REDACT_PII': 'False',
+}
+
+def _write_env_file(env_file: Path, config: dict) -> None:
+    """Write the .env file in one call, swapping it into place atomically."""
+    body = "\n".join([
+        "# AI Configuration",
+        f"OPENAI_API_KEY={config['OPENAI_API_KEY']}",
+        f"AI_PROVIDER={config['AI_PROVIDER']}",
+        f"AI_MODEL={config['AI_MODEL']}",
+        "",
+        "# Application Settings",
+        f"LOG_LEVEL={config['LOG_LEVEL']}",
+        f"REDACT_PII={config['REDACT_PII']}",
+    ]) + "\n"
+    # Path('.env').with_suffix() would misread the dotfile name, so append instead
+    tmp_file = env_file.with_name(env_file.name + '.tmp')
+    try:
+        # The file holds the API key: create it owner-only, then keep the
+        # mode of an existing .env so a save never widens its permissions
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(body)
+        if env_file.exists():
+            shutil.copymode(env_file, tmp_file)
+        os.replace(tmp_file, env_file)
+    except BaseException:
+        # Don't leave a half-written secrets file next to .env
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        raise
+
+def _mask(key: str) -> str:
+    """Show only the prefix and last four characters of an API key."""
+    return f"{key[:7]}...{key[-4:]}" if len(key) > 20 else "***"
+
+def _load_streamlit_secrets() -> dict:
+    """Streamlit secrets as a plain dict, or {} when not running under Streamlit."""
+    try:
+        import streamlit as _st
+
+        # st.secrets behaves like a dict; copy it so later reads are plain lookups
+        return dict(_st.secrets)
+    except Exception:
+        return {}
+
+def _test_openai_connection(api_key: str) -> None:
+    """Send a tiny request to check the key; give up after a few seconds instead of hanging."""
+    try:
+        import openai
+    except ImportError as e:
+        print(f"⚠️  Warning: Could not verify OpenAI connection: {e}")
+        print("   Please check your API key and try again.")
+        return
+    
+    try:
+        # Fail fast: no retries and a short timeout, so a bad network can't stall setup
+        client = openai.OpenAI(api_key=api_key, timeout=_CONNECTION_TEST_TIMEOUT, max_retries=0)
+        client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "Say 'OK' if you can read this."}],
+            max_tokens=5
+        )
+        print("✅ OpenAI connection successful!")
+    except (openai.APITimeoutError, openai.APIConnectionError) as e:
+        print(f"⚠️  Warning: Could not reach OpenAI (timeout {_CONNECTION_TEST_TIMEOUT:.0f}s): {e}")
+        print("   Check your network connection and try again.")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not verify OpenAI connection: {e}")
+        print("   Please check your API key and try again.")
+
 def configure_openai():
     """Interactive configuration for OpenAI API key."""
     print("🎖️ Operation MOS - OpenAI Configuration")
     print("=" * 50)
     print()
     
+    # Environment and Streamlit secrets are each read once into a dict keyed by
+    # the upper-case name.
+    env = os.environ
+    env_config = {key: env.get(key) or env.get(key.lower()) for key in _CONFIG_KEYS}
+    
+    # Secrets only fill values the environment leaves empty, so skip the (slow)
+    # streamlit import entirely when the environment already provides everything.
+    # Otherwise load them on a worker thread so the import overlaps .env parsing.
+    secrets_future = None
+    if not all(env_config.values()):
+        executor = ThreadPoolExecutor(max_workers=1)
+        secrets_future = executor.submit(_load_streamlit_secrets)
+        executor.shutdown(wait=False)
+    
     env_file = Path(".env")
     
     # Read existing .env if it exists
     existing_config = {}
     if env_file.exists():
-        with open(env_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    existing_config[key.strip()] = value.strip()
+        for line in env_file.read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                existing_config[key.strip()] = value.strip()
+    # Fold defaults in once; everything below subscripts directly
+    for key, value in _ENV_DEFAULTS.items():
+        existing_config.setdefault(key, value)
     
     print("Current configuration:")
-    print(f"  AI Provider: {existing_config.get('AI_PROVIDER', 'mock')}")
-    print(f"  AI Model: {existing_config.get('AI_MODEL', 'gpt-4o-mini')}")
+    print(f"  AI Provider: {existing_config['AI_PROVIDER']}")
+    print(f"  AI Model: {existing_config['AI_MODEL']}")
     
-    current_key = existing_config.get('OPENAI_API_KEY', '')
-    if current_key and current_key != 'your_openai_api_key_here':
-        masked_key = current_key[:7] + '...' + current_key[-4:] if len(current_key) > 20 else '***'
-        print(f"  API Key: {masked_key} (configured)")
+    current_key = existing_config['OPENAI_API_KEY']
+    if current_key and current_key != _ENV_DEFAULTS['OPENAI_API_KEY']:
+        print(f"  API Key: {_mask(current_key)} (configured)")
     else:
         print(f"  API Key: Not configured")
     
@@ -41,42 +147,27 @@ def configure_openai():
     print("  2. Enter it below (or press Enter to skip)")
     print()
     # First check environment variables and (if available) Streamlit secrets
-    env_api_key = os.getenv('OPENAI_API_KEY') or os.getenv('openai_api_key')
-    env_ai_provider = os.getenv('AI_PROVIDER') or os.getenv('ai_provider')
-    env_ai_model = os.getenv('AI_MODEL') or os.getenv('ai_model')
-
-    # Try to read Streamlit secrets if running in that environment
-    st_secrets = {}
-    try:
-        import streamlit as _st
-
-        # st.secrets behaves like a dict
-        st_secrets = _st.secrets or {}
-    except Exception:
-        st_secrets = {}
-
-    secrets_api_key = st_secrets.get('OPENAI_API_KEY') or st_secrets.get('openai_api_key')
-    secrets_ai_provider = st_secrets.get('AI_PROVIDER') or st_secrets.get('ai_provider')
-    secrets_ai_model = st_secrets.get('AI_MODEL') or st_secrets.get('ai_model')
+    # (started in the background above)
+    st_secrets = secrets_future.result() if secrets_future else {}
+    secrets_config = {key: st_secrets.get(key) or st_secrets.get(key.lower()) for key in _CONFIG_KEYS}
 
     # Prefer explicit environment variables, then Streamlit secrets, then existing .env
-    api_key = env_api_key or secrets_api_key or existing_config.get('OPENAI_API_KEY', '')
-    ai_provider = env_ai_provider or secrets_ai_provider or existing_config.get('AI_PROVIDER', 'mock')
-    ai_model = env_ai_model or secrets_ai_model or existing_config.get('AI_MODEL', 'gpt-4o-mini')
+    api_key = env_config['OPENAI_API_KEY'] or secrets_config['OPENAI_API_KEY'] or existing_config['OPENAI_API_KEY']
+    ai_provider = env_config['AI_PROVIDER'] or secrets_config['AI_PROVIDER'] or existing_config['AI_PROVIDER']
+    ai_model = env_config['AI_MODEL'] or secrets_config['AI_MODEL'] or existing_config['AI_MODEL']
 
     # If configuration is available from env/secrets, show and exit (non-interactive)
     if api_key or ai_provider:
         # Update existing_config with detected values so calling code can persist if desired
-        existing_config['OPENAI_API_KEY'] = api_key or existing_config.get('OPENAI_API_KEY', 'your_openai_api_key_here')
-        existing_config['AI_PROVIDER'] = ai_provider or existing_config.get('AI_PROVIDER', 'mock')
-        existing_config['AI_MODEL'] = ai_model or existing_config.get('AI_MODEL', 'gpt-4o-mini')
+        existing_config['OPENAI_API_KEY'] = api_key or existing_config['OPENAI_API_KEY']
+        existing_config['AI_PROVIDER'] = ai_provider or existing_config['AI_PROVIDER']
+        existing_config['AI_MODEL'] = ai_model or existing_config['AI_MODEL']
 
         print('\nDetected configuration from environment / Streamlit secrets:')
-        print(f"  AI Provider: {existing_config.get('AI_PROVIDER')}")
-        print(f"  AI Model: {existing_config.get('AI_MODEL')}")
-        if existing_config.get('OPENAI_API_KEY') and existing_config.get('OPENAI_API_KEY') != 'your_openai_api_key_here':
-            masked_key = existing_config['OPENAI_API_KEY'][:7] + '...' + existing_config['OPENAI_API_KEY'][-4:] if len(existing_config['OPENAI_API_KEY']) > 20 else '***'
-            print(f"  API Key: {masked_key} (from env/secrets)")
+        print(f"  AI Provider: {existing_config['AI_PROVIDER']}")
+        print(f"  AI Model: {existing_config['AI_MODEL']}")
+        if existing_config['OPENAI_API_KEY'] and existing_config['OPENAI_API_KEY'] != _ENV_DEFAULTS['OPENAI_API_KEY']:
+            print(f"  API Key: {_mask(existing_config['OPENAI_API_KEY'])} (from env/secrets)")
         else:
             print("  API Key: Not configured")
 
@@ -90,17 +181,9 @@ def configure_openai():
         # Update configuration
         existing_config['OPENAI_API_KEY'] = api_key
         existing_config['AI_PROVIDER'] = 'openai'
-        existing_config['AI_MODEL'] = existing_config.get('AI_MODEL', 'gpt-4o-mini')
         
         # Write .env file
-        with open(env_file, 'w') as f:
-            f.write("# AI Configuration\n")
-            f.write(f"OPENAI_API_KEY={existing_config['OPENAI_API_KEY']}\n")
-            f.write(f"AI_PROVIDER={existing_config['AI_PROVIDER']}\n")
-            f.write(f"AI_MODEL={existing_config['AI_MODEL']}\n")
-            f.write("\n# Application Settings\n")
-            f.write(f"LOG_LEVEL={existing_config.get('LOG_LEVEL', 'INFO')}\n")
-            f.write(f"REDACT_PII={existing_config.get('REDACT_PII', 'False')}\n")
+        _write_env_file(env_file, existing_config)
         
         print()
         print("✅ Configuration saved!")
@@ -110,30 +193,16 @@ def configure_openai():
         print("Testing OpenAI connection...")
         
         # Test the configuration
-        try:
-            import openai
-            client = openai.OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[{"role": "user", "content": "Say 'OK' if you can read this."}],
-                max_tokens=5
-            )
-            print("✅ OpenAI connection successful!")
-        except Exception as e:
-            print(f"⚠️  Warning: Could not verify OpenAI connection: {e}")
-            print("   Please check your API key and try again.")
+        _test_openai_connection(api_key)
     else:
         # Configure for mock AI
         existing_config['AI_PROVIDER'] = 'mock'
         
-        with open(env_file, 'w') as f:
-            f.write("# AI Configuration\n")
-            f.write(f"OPENAI_API_KEY=your_openai_api_key_here\n")
-            f.write(f"AI_PROVIDER=mock\n")
-            f.write(f"AI_MODEL=gpt-4o-mini\n")
-            f.write("\n# Application Settings\n")
-            f.write(f"LOG_LEVEL={existing_config.get('LOG_LEVEL', 'INFO')}\n")
-            f.write(f"REDACT_PII={existing_config.get('REDACT_PII', 'False')}\n")
+        _write_env_file(env_file, {
+            **existing_config,
+            'OPENAI_API_KEY': _ENV_DEFAULTS['OPENAI_API_KEY'],
+            'AI_MODEL': _ENV_DEFAULTS['AI_MODEL'],
+        })
         
         print()
         print("✅ Configuration saved!")
@@ -0,0 +1,12 @@
+"""
+Small text formatting helpers shared by the resume services.
+"""
+
+from typing import Optional
+
+
+def format_location(city: Optional[str], state: Optional[str]) -> str:
+    """Format city and state for display."""
+    if city and state:
+        return f"{city}, {state}"
+    return city or state or ''
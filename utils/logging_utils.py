@@ -4,34 +4,160 @@ Logging utilities with PII redaction support.
 
 import logging
 import re
-from typing import Any
+import threading
+from functools import lru_cache
+from typing import Optional, Set
 
+try:
+    # Optional SIMD multi-pattern matcher; used only to decide which regex passes to run
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-class PIIRedactingFormatter(logging.Formatter):
-    """Custom formatter that redacts PII from log messages."""
+# Pattern ids shared by the Hyperscan database and PIIRedactingFilter.redact
+_EMAIL_ID, _PHONE_ID, _NAME_ID = 0, 1, 2
+
+# Loose supersets of the filter patterns below (no word boundaries, any
+# separator), so a line Hyperscan does not flag cannot match the exact regex
+_HS_EXPRESSIONS = (
+    rb'[A-Za-z0-9._%+-]@[A-Za-z0-9.-]+\.[A-Za-z|]{2}',
+    rb'\d{3}.?\d{3}.?\d{4}',
+    rb'name["\']?[^:=]*[:=]',
+)
+
+
+# Used only to render tracebacks so they can be redacted before formatting
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+def _build_hs_database():
+    """Compile the PII prefilter database, or return None when Hyperscan is unavailable."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    flags = (hyperscan.HS_FLAG_DOTALL | hyperscan.HS_FLAG_UTF8
+             | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH)
+    db.compile(
+        expressions=list(_HS_EXPRESSIONS),
+        ids=[_EMAIL_ID, _PHONE_ID, _NAME_ID],
+        # NAME_PATTERN is case-insensitive
+        flags=[flags, flags, flags | hyperscan.HS_FLAG_CASELESS],
+    )
+    return db
+
+
+class PIIRedactingFilter(logging.Filter):
+    """
+    Handler filter that redacts PII from log records before they are formatted.
+    Runs only for records that pass the handler's level, so suppressed records
+    never pay for the regex passes.
+    """
+    
+    # Patterns for PII detection (ASCII classes; name keys match in any case)
+    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.ASCII)
+    PHONE_PATTERN = re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b', re.ASCII)
+    NAME_PATTERN = re.compile(
+        r'(full_name|name)[\"\']?\s*[:=]\s*["\']([^"\']+)["\']', re.IGNORECASE | re.ASCII
+    )
     
-    # Patterns for PII detection
-    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    PHONE_PATTERN = re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b')
-    NAME_PATTERN = re.compile(r'(full_name|name)[\"\']?\s*[:=]\s*["\']([^"\']+)["\']')
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        # One database (and scratch space) per filter. Handlers call filters
+        # outside their own lock, so scans are serialized here.
+        self._hs_db = _build_hs_database()
+        self._hs_lock = threading.Lock()
     
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record with PII redaction."""
-        message = super().format(record)
+    def _candidate_ids(self, message: str) -> Optional[Set[int]]:
+        """Ids of patterns that may match, or None if every pass should run."""
+        if self._hs_db is None:
+            return None
+        try:
+            data = message.encode('utf-8')
+        except UnicodeEncodeError:
+            # Lone surrogates are not valid UTF-8 input for Hyperscan
+            return None
         
-        # Redact email addresses
-        message = self.EMAIL_PATTERN.sub('[EMAIL_REDACTED]', message)
+        hits = set()
+        
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(pattern_id)
+        
+        with self._hs_lock:
+            self._hs_db.scan(data, match_event_handler=on_match)
+        return hits
+    
+    def redact(self, message: str) -> str:
+        """Return message with emails, phone numbers and name values redacted."""
+        candidates = self._candidate_ids(message)
+        
+        # Redact email addresses (an address always contains '@')
+        if '@' in message and (candidates is None or _EMAIL_ID in candidates):
+            message = self.EMAIL_PATTERN.sub('[EMAIL_REDACTED]', message)
         
         # Redact phone numbers
-        message = self.PHONE_PATTERN.sub('[PHONE_REDACTED]', message)
+        if candidates is None or _PHONE_ID in candidates:
+            message = self.PHONE_PATTERN.sub('[PHONE_REDACTED]', message)
         
-        # Redact names in key-value pairs
-        message = self.NAME_PATTERN.sub(r'\1: "[NAME_REDACTED]"', message)
+        # Redact names in key-value pairs (both keys end in 'name', in any case)
+        if 'name' in message.lower() and (candidates is None or _NAME_ID in candidates):
+            message = self.NAME_PATTERN.sub(r'\1: "[NAME_REDACTED]"', message)
         
         return message
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Redact the record's message, traceback and stack text in place."""
+        # Store the redacted text on the record itself, so it stays a plain,
+        # picklable LogRecord for queue, socket and multiprocessing handlers
+        try:
+            message = record.getMessage()
+        except Exception:
+            # Bad format args; let the handler report it through handleError
+            return True
+        record.msg = self.redact(message)
+        record.args = None
+        
+        # Formatters reuse a cached exc_text, so redacting it here covers tracebacks
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+        if record.exc_text:
+            record.exc_text = self.redact(record.exc_text)
+        if record.stack_info:
+            record.stack_info = self.redact(record.stack_info)
+        
+        return True
 
 
-def get_logger(name: str, redact_pii: bool = True) -> logging.Logger:
+class RedactingAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that redacts known PII fields passed as structured extras,
+    e.g. logger.info("user login", extra={'email': email}). Field values are
+    replaced outright, with no regex scan over the interpolated message.
+    """
+    
+    # extra key -> replacement ('name' itself is reserved by LogRecord)
+    REDACTED_FIELDS = {
+        'email': '[EMAIL_REDACTED]',
+        'phone': '[PHONE_REDACTED]',
+        'full_name': '[NAME_REDACTED]',
+    }
+    
+    def __init__(self, logger: logging.Logger, redact_extras: bool = True):
+        super().__init__(logger, None)
+        self.redact_extras = redact_extras
+    
+    def process(self, msg, kwargs):
+        """Redact PII fields in the caller's extra dict (kept, unlike the base class)."""
+        extra = kwargs.get('extra')
+        if extra and self.redact_extras:
+            fields = self.REDACTED_FIELDS
+            kwargs['extra'] = {
+                key: fields[key] if key in fields and value else value
+                for key, value in extra.items()
+            }
+        return msg, kwargs
+
+
+def get_logger(name: str, redact_pii: bool = True) -> RedactingAdapter:
     """
     Get a configured logger instance.
     
@@ -40,24 +166,33 @@ def get_logger(name: str, redact_pii: bool = True) -> logging.Logger:
         redact_pii: Whether to redact PII from logs
     
     Returns:
-        Configured logger instance
+        Configured logger adapter; message text is redacted by the handler
+        filter and structured extras by the adapter
     """
+    return _build_logger(name, redact_pii)
+
+
+@lru_cache(maxsize=2)
+def _shared_handler(redact_pii: bool) -> logging.Handler:
+    """One stderr handler (and formatter/filter) per redaction mode, shared by every logger."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    
+    if redact_pii:
+        handler.addFilter(PIIRedactingFilter())
+    
+    return handler
+
+
+@lru_cache(maxsize=None)
+def _build_logger(name: str, redact_pii: bool) -> RedactingAdapter:
+    """Configure a logger once per (name, redact_pii); repeat calls are a cache hit."""
     logger = logging.getLogger(name)
     
     if not logger.handlers:
-        handler = logging.StreamHandler()
-        
-        if redact_pii:
-            formatter = PIIRedactingFormatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-        else:
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-        
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_shared_handler(redact_pii))
         logger.setLevel(logging.INFO)
     
-    return logger
+    return RedactingAdapter(logger, redact_extras=redact_pii)
@@ -1,54 +1,39 @@
 """
 Enhanced resume preview rendering for Step 4.
 Professional format matching Resume.docx template.
-Uses mammoth library to convert DOCX to clean HTML for accurate preview.
+Converts DOCX to clean HTML for accurate preview with a streamed lxml parse,
+falling back to the mammoth library.
 """
 
+import hashlib
+import html
+import json
+import os
+import re
+import threading
+import zipfile
+from functools import lru_cache
+from itertools import groupby
 import streamlit as st
+from streamlit.components.v1 import html as st_html
+from streamlit.runtime.scriptrunner import add_script_run_ctx
 from typing import Dict, List
 import mammoth
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+from lxml import etree
 from pathlib import Path
+from utils.logging_utils import get_logger
 
+logger = get_logger(__name__)
 
-def convert_docx_to_html(docx_path: str) -> str:
-    """
-    Convert a DOCX file to clean HTML using mammoth library.
-    
-    Args:
-        docx_path: Path to the DOCX file
-        
-    Returns:
-        HTML string representation of the document
-    """
-    try:
-        with open(docx_path, "rb") as docx_file:
-            result = mammoth.convert_to_html(docx_file)
-            html = result.value  # The generated HTML
-            messages = result.messages  # Any messages such as warnings
-            
-            
-            return html
-    except Exception as e:
-        st.error(f"Error converting DOCX to HTML: {e}")
-        return ""
 
+# Scheme and "www." prefix dropped from LinkedIn URLs in the contact line
+_LINKEDIN_STRIP = re.compile(r'^(?:https?://)?(?:www\.)?', re.IGNORECASE)
 
-def render_docx_preview(docx_path: str):
-    """
-    Render a professional preview of a DOCX resume using mammoth.
-    
-    Args:
-        docx_path: Path to the generated DOCX file
-    """
-    # Convert DOCX to HTML
-    html_content = convert_docx_to_html(docx_path)
-    
-    if not html_content:
-        st.error("Unable to generate preview")
-        return
-    
-    # Custom CSS for professional resume styling matching DOCX format exactly
-    custom_css = """
+# Static markup is built once at import time; Streamlit reruns the script on
+# every widget interaction and only the dynamic parts need formatting.
+# Custom CSS for professional resume styling matching DOCX format exactly
+_CUSTOM_CSS = """
     <style>
         .resume-preview {
             background: white !important;
@@ -212,16 +197,290 @@ def render_docx_preview(docx_path: str):
         }
     </style>
     """
+
+_SECTION_TMPL = """<div style="margin: 1.5rem 0;">
+            <h2 style="color: #000000; font-size: {font_size}; font-weight: 700; text-transform: uppercase; 
+                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
+                {title}
+            </h2>"""
+
+_SUMMARY_PARAGRAPH = """<p style="color: #000000 !important; margin: 0; line-height: 1.0; text-align: justify; font-size: 10pt; font-family: 'Calibri Light', 'Calibri', 'Arial', sans-serif;">{}</p>"""
+_SECTION_CLOSE = "</div>"
+
+_SKILLS_GRID_OPEN = '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 0.5rem; margin: 0;">'
+_SKILL_ITEM = '<div style="color: #000000; font-size: 0.85rem;">• {}</div>'
+_BULLET_LIST_OPEN = '<ul style="margin: 0.25rem 0; padding-left: 1.2rem; color: #000000;">'
+_BULLET_ITEM = '<li style="margin: 0.15rem 0; line-height: 1.4; font-size: 0.83rem; color: #000000;">{}</li>'
+_COMPACT_LIST_OPEN = '<ul style="margin: 0.3rem 0; padding-left: 1.2rem;">'
+_COMPACT_ITEM = '<li style="margin: 0.15rem 0; font-size: 0.83rem; line-height: 1.3;">{}</li>'
+_MORE_NOTE = '<p style="color: #000000; margin: 0.25rem 0 0 0; font-size: 0.8rem; font-style: italic;">+{} more…</p>'
+
+# Entries shown per preview section; the DOCX itself is not truncated
+_MAX_ROLES = 8
+_MAX_EDUCATION = 6
+_MAX_VOLUNTEER = 10
+
+# Height of the iframe the DOCX preview is rendered into; longer resumes scroll
+_DOCX_PREVIEW_HEIGHT = 1100
+
+# WordprocessingML tags read by the fast preview converter
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_TBL = _W + 'tbl'
+_W_TR = _W + 'tr'
+_W_TC = _W + 'tc'
+_W_R = _W + 'r'
+_W_RPR = _W + 'rPr'
+_W_T = _W + 't'
+_W_TAB = _W + 'tab'
+_W_BR = _W + 'br'
+_W_B = _W + 'b'
+_W_I = _W + 'i'
+_W_VAL = _W + 'val'
+_TOGGLE_OFF = frozenset(('0', 'false', 'off'))
+
+
+@lru_cache(maxsize=None)
+def _open_section(title: str, font_size: str = "1.1rem") -> str:
+    """Opening markup for a preview section; close it with ``_SECTION_CLOSE``."""
+    return _SECTION_TMPL.format(title=title, font_size=font_size)
+
+
+def _append_more_note(parts: List[str], total: int, limit: int) -> None:
+    if total > limit:
+        parts.append(_MORE_NOTE.format(total - limit))
+
+
+def _h(value) -> str:
+    """Escape user-provided text (names, dates, bullets...) for the preview HTML."""
+    return html.escape(str(value))
+
+
+def _role_fields(role: Dict) -> tuple:
+    """(job_title, employer, location, start_date, end_date, responsibilities, bullets) of a role."""
+    get = role.get
+    return (
+        get('job_title', 'Position'),
+        get('employer', 'Organization'),
+        get('location', ''),
+        get('start_date', 'Start'),
+        get('end_date', 'Present'),
+        get('responsibilities'),
+        get('ai_bullets') or (),
+    )
+
+
+def _edu_fields(edu: Dict) -> tuple:
+    """(degree, field_of_study, institution, year, gpa) of an education entry."""
+    get = edu.get
+    return (
+        get('degree', 'Degree'),
+        get('field_of_study', ''),
+        get('institution', 'Institution'),
+        get('year', 'Year'),
+        get('gpa', ''),
+    )
+
+
+def _vol_fields(vol: Dict) -> tuple:
+    """(role, organization, date_range, description) of a volunteer entry, accepting legacy keys."""
+    get = vol.get
+    return (
+        get('role') or get('title') or 'Role',
+        get('organization') or get('org') or 'Organization',
+        get('date_range') or get('duration') or '',
+        get('description') or '',
+    )
+
+
+def _cert_label(cert: Dict) -> str:
+    """Certification name, followed by its issuer when one is set."""
+    cert_name = cert.get('name', 'Certification')
+    issuer = cert.get('issuer', '')
+    return f"{cert_name} – {issuer}" if issuer else cert_name
+
+
+def _run_format(run) -> tuple:
+    """(bold, italic) flags of a ``w:r`` element."""
+    rpr = run.find(_W_RPR)
+    if rpr is None:
+        return False, False
+    flags = []
+    for tag in (_W_B, _W_I):
+        el = rpr.find(tag)
+        flags.append(el is not None and el.get(_W_VAL) not in _TOGGLE_OFF)
+    return tuple(flags)
+
+
+def _run_html(run) -> str:
+    out = []
+    for child in run:
+        if child.tag == _W_T:
+            out.append(html.escape(child.text or '', quote=False))
+        elif child.tag == _W_TAB:
+            out.append('\t')
+        elif child.tag == _W_BR:
+            out.append('<br />')
+    return ''.join(out)
+
+
+def _paragraph_html(p) -> str:
+    """
+    Render a ``w:p`` as ``<p>`` with ``<strong>``/``<em>`` runs.
+    
+    Adjacent runs with the same formatting are merged and empty paragraphs
+    are dropped, as mammoth does, so the preview CSS selectors still apply.
+    """
+    chunks = []
+    for (bold, italic), runs in groupby(p.iter(_W_R), key=_run_format):
+        text = ''.join(_run_html(run) for run in runs)
+        if not text:
+            continue
+        if italic:
+            text = f'<em>{text}</em>'
+        if bold:
+            text = f'<strong>{text}</strong>'
+        chunks.append(text)
+    return f"<p>{''.join(chunks)}</p>" if chunks else ''
+
+
+def _table_html(tbl) -> str:
+    rows = []
+    for tr in tbl.iterfind(_W_TR):
+        cells = ''.join(
+            f"<td>{''.join(_paragraph_html(p) for p in tc.iterfind(_W_P))}</td>"
+            for tc in tr.iterfind(_W_TC)
+        )
+        rows.append(f'<tr>{cells}</tr>')
+    return f"<table>{''.join(rows)}</table>"
+
+
+def _fast_docx_to_html(path: str) -> str:
+    """
+    Convert the body of a DOCX to preview HTML with a streamed parse.
+    
+    Only ``word/document.xml`` is read; styles, numbering and images are
+    ignored. Top-level paragraphs and tables are emitted as they close and
+    then cleared, so memory stays flat in the document length.
+    """
+    parts = []
+    with zipfile.ZipFile(path) as z, z.open('word/document.xml') as f:
+        for _, el in etree.iterparse(f, events=('end',), tag=(_W_P, _W_TBL)):
+            parent = el.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue  # Table cell paragraphs are rendered with their table
+            parts.append(_paragraph_html(el) if el.tag == _W_P else _table_html(el))
+            el.clear()
+            while el.getprevious() is not None:
+                del parent[0]
+    return ''.join(parts)
+
+
+# Bounded: each entry is a whole rendered resume, and every regeneration
+# (new mtime) adds one
+@st.cache_data(show_spinner=False, max_entries=32, ttl="1h")
+def _docx_to_html_cached(path: str, mtime: float, size: int) -> str:
+    """
+    Convert ``path`` to HTML, falling back to mammoth if the fast path fails.
+    
+    ``mtime`` and ``size`` are only part of the cache key, so a regenerated
+    file at the same path is converted again instead of served stale.
+    """
+    try:
+        return _fast_docx_to_html(path)
+    except Exception as e:
+        logger.warning("Fast DOCX preview failed for %s, using mammoth: %s", path, e)
+    with open(path, "rb") as docx_file:
+        return mammoth.convert_to_html(docx_file).value
+
+
+def convert_docx_to_html(docx_path: str) -> str:
+    """
+    Convert a DOCX file to clean HTML for the preview.
+    
+    Results are cached per file path, modification time and size, so
+    Streamlit reruns do not repeat the conversion for an unchanged file.
+    
+    Args:
+        docx_path: Path to the DOCX file
+        
+    Returns:
+        HTML string representation of the document
+    """
+    try:
+        stat = os.stat(docx_path)
+        return _docx_to_html_cached(str(docx_path), stat.st_mtime, stat.st_size)
+    except Exception as e:
+        st.error(f"Error converting DOCX to HTML: {e}")
+        return ""
+
+
+def _prewarm(path: str, mtime: float, size: int) -> None:
+    try:
+        _docx_to_html_cached(path, mtime, size)
+    except Exception as e:
+        # The render path converts again and reports the error to the user
+        logger.warning("Preview pre-warm failed for %s: %s", path, e)
+
+
+def prewarm_preview(docx_path: str) -> None:
+    """
+    Start converting a freshly generated DOCX to HTML in the background.
+    
+    The result lands in the same cache ``convert_docx_to_html`` reads, so
+    the preview render that follows is a cache hit (or waits on the
+    in-flight conversion instead of starting a second one).
+    
+    Args:
+        docx_path: Path to the generated DOCX file
+    """
+    try:
+        stat = os.stat(docx_path)
+    except OSError:
+        return
+    thread = threading.Thread(
+        target=_prewarm,
+        args=(str(docx_path), stat.st_mtime, stat.st_size),
+        daemon=True,
+    )
+    add_script_run_ctx(thread)
+    thread.start()
+
+
+def render_docx_preview(docx_path: str):
+    """
+    Render a professional preview of a DOCX resume.
+    
+    The preview and its stylesheet go into an isolated iframe component, so
+    the resume CSS is not applied to (or re-evaluated against) the rest of
+    the app and unrelated widget events do not re-render it.
+    
+    Args:
+        docx_path: Path to the generated DOCX file
+    """
+    # Convert DOCX to HTML
+    html_content = convert_docx_to_html(docx_path)
+    
+    if not html_content:
+        st.error("Unable to generate preview")
+        return
     
     # Render the preview
-    st.markdown(custom_css, unsafe_allow_html=True)
-    st.markdown(f'<div class="resume-preview">{html_content}</div>', unsafe_allow_html=True)
+    st_html(
+        f'{_CUSTOM_CSS}<div class="resume-preview">{html_content}</div>',
+        height=_DOCX_PREVIEW_HEIGHT,
+        scrolling=True,
+    )
 
 
 def render_enhanced_resume_preview(profile_data: Dict, work_history: List, education: List, certifications: List, volunteer: List = None):
     """
     Render a professional resume preview matching the Resume.docx template format.
     
+    The HTML is a pure function of the inputs, so it is cached on a digest of
+    them; reruns with unchanged data cost one hash and one st.markdown call.
+    
     Args:
         profile_data: Dictionary containing profile information
         work_history: List of work history entries
@@ -229,17 +488,36 @@ def render_enhanced_resume_preview(profile_data: Dict, work_history: List, educa
         certifications: List of certification entries
         volunteer: Optional list of volunteer experience entries
     """
-    
+    ai_summary = st.session_state.get('ai_summary')
+    inputs = (profile_data, work_history, education, certifications, volunteer, ai_summary)
+    try:
+        # Key on the data itself (models via their JSON dump, dates as ISO
+        # strings), never on str(), which need not be unique or stable
+        payload = json.dumps(to_jsonable_python(inputs), sort_keys=True)
+    except (PydanticSerializationError, TypeError, ValueError):
+        # No value-based key for these inputs: render without the cache
+        st.markdown(_build_preview_html(*inputs), unsafe_allow_html=True)
+        return
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    st.markdown(_cached_preview_html(digest, inputs), unsafe_allow_html=True)
+
+
+# Entries hold profile data, so keep few of them and only briefly
+@st.cache_data(show_spinner=False, max_entries=32, ttl="30m")
+def _cached_preview_html(digest: str, _inputs: tuple) -> str:
+    # Only ``digest`` is hashed by Streamlit; ``_inputs`` is what it describes
+    return _build_preview_html(*_inputs)
 
+
+def _build_preview_html(profile_data: Dict, work_history: List, education: List, certifications: List, volunteer: List, ai_summary: str) -> str:
+    """Build the enhanced preview HTML; sections are joined into one blob."""
+    sections = []
     
     # ===== HEADER SECTION =====
+    # Opening and closing tags of each section stay in the same fragment.
     full_name = profile_data.get('full_name', 'YOUR NAME').upper()
-    st.markdown(f"""
-    <div style="text-align: center; border-bottom: 2px solid #000000; padding-bottom: 0.5rem; margin-bottom: 1rem;">
-        <h1 style="color: #000000; margin: 0; font-size: 1.4rem; font-weight: 700; letter-spacing: 0.3px;">
-            {full_name}
-        </h1>
-    """, unsafe_allow_html=True)
+    parts = [f"""<div style="text-align: center; border-bottom: 2px solid #000000; padding-bottom: 0.5rem; margin-bottom: 1rem;">
+        <h1 style="color: #000000; margin: 0; font-size: 1.4rem; font-weight: 700; letter-spacing: 0.3px;">{_h(full_name)}</h1>"""]
     
     # Contact Information
     contact_parts = []
@@ -250,212 +528,116 @@ def render_enhanced_resume_preview(profile_data: Dict, work_history: List, educa
     if profile_data.get('email'):
         contact_parts.append(profile_data['email'])
     if profile_data.get('linkedin'):
-        linkedin_clean = profile_data['linkedin'].replace('https://', '').replace('http://', '').replace('www.', '')
+        linkedin_clean = _LINKEDIN_STRIP.sub('', profile_data['linkedin'], count=1)
         contact_parts.append(linkedin_clean)
     
     if contact_parts:
-        st.markdown(f"""
-        <p style="color: #000000; text-align: center; margin: 0.75rem 0 0 0; font-size: 0.85rem; line-height: 1.4;">
-            {' | '.join(contact_parts)}
-        </p>
-        """, unsafe_allow_html=True)
+        parts.append(f"""<p style="color: #000000; text-align: center; margin: 0.75rem 0 0 0; font-size: 0.85rem; line-height: 1.4;">{' | '.join(map(_h, contact_parts))}</p>""")
     
     # Security Clearance Badge
     if profile_data.get('security_clearance') and profile_data['security_clearance'] != 'None':
-        st.markdown(f"""
-        <p style="text-align: center; margin: 0.5rem 0 0 0;">
-            <span style="background: #1e40af; padding: 0.25rem 0.75rem; border-radius: 4px; font-size: 0.85rem; font-weight: 600;">
-                🔒 {profile_data['security_clearance']} Clearance
-            </span>
-        </p>
-        """, unsafe_allow_html=True)
+        parts.append(f"""<p style="text-align: center; margin: 0.5rem 0 0 0;">
+            <span style="background: #1e40af; padding: 0.25rem 0.75rem; border-radius: 4px; font-size: 0.85rem; font-weight: 600;">🔒 {_h(profile_data['security_clearance'])} Clearance</span>
+        </p>""")
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    parts.append(_SECTION_CLOSE)
+    sections.append("\n".join(parts))
     
     # ===== PROFESSIONAL SUMMARY =====
-    ai_summary = st.session_state.get('ai_summary')
     if ai_summary:
-        st.markdown(f"""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 11pt; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                SUMMARY
-            </h2>
-            <p style="color: #000000 !important; margin: 0; line-height: 1.0; text-align: justify; font-size: 10pt; font-family: 'Calibri Light', 'Calibri', 'Arial', sans-serif;">
-                {ai_summary}
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        sections.append("\n".join((_open_section("SUMMARY", "11pt"), _SUMMARY_PARAGRAPH.format(_h(ai_summary)), _SECTION_CLOSE)))
     
     # ===== CORE COMPETENCIES =====
     core_skills = profile_data.get('core_skills', [])
     if core_skills:
-        skills_display = core_skills[:12]  # Show top 12 skills
-        skills_html = '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 0.5rem; margin: 0;">'
-        for skill in skills_display:
-            skills_html += f'<div style="color: #000000; font-size: 0.85rem;">• {skill}</div>'
-        skills_html += '</div>'
+        # Show top 12 skills
+        skills_html = _SKILLS_GRID_OPEN + "".join(_SKILL_ITEM.format(_h(skill)) for skill in core_skills[:12]) + '</div>'
         
-        st.markdown(f"""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 1.1rem; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                CORE COMPETENCIES
-            </h2>
-            {skills_html}
-        </div>
-        """, unsafe_allow_html=True)
+        sections.append("\n".join((_open_section("CORE COMPETENCIES"), skills_html, _SECTION_CLOSE)))
     
     # ===== PROFESSIONAL EXPERIENCE =====
     if work_history:
-        st.markdown("""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 1.1rem; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                PROFESSIONAL EXPERIENCE
-            </h2>
-        """, unsafe_allow_html=True)
+        parts = [_open_section("PROFESSIONAL EXPERIENCE")]
         
-        for idx, role in enumerate(work_history):
-            job_title = role.get('job_title', 'Position')
-            employer = role.get('employer', 'Organization')
-            location = role.get('location', '')
-            start_date = role.get('start_date', 'Start')
-            end_date = role.get('end_date', 'Present')
+        for idx, role in enumerate(work_history[:_MAX_ROLES]):
+            job_title, employer, location, start_date, end_date, responsibilities, bullets = _role_fields(role)
             
-            st.markdown(f"""
-            <div style="margin: {'1rem 0 1.5rem 0' if idx > 0 else '0 0 1.5rem 0'};">
+            parts.append(f"""<div style="margin: {'1rem 0 1.5rem 0' if idx > 0 else '0 0 1.5rem 0'};">
                 <div style="display: flex; justify-content: space-between; align-items: baseline;">
-                    <h3 style="color: #000000; margin: 0; font-size: 0.95rem; font-weight: 700;">
-                        {job_title}
-                    </h3>
-                    <span style="color: #000000; font-size: 0.85rem; font-style: italic;">
-                        {start_date} – {end_date}
-                    </span>
+                    <h3 style="color: #000000; margin: 0; font-size: 0.95rem; font-weight: 700;">{_h(job_title)}</h3>
+                    <span style="color: #000000; font-size: 0.85rem; font-style: italic;">{_h(start_date)} – {_h(end_date)}</span>
                 </div>
-                <p style="color: #000000; margin: 0.25rem 0 0.5rem 0; font-size: 0.85rem; font-weight: 600;">
-                    {employer}{f" | {location}" if location else ''}
-                </p>
-            """, unsafe_allow_html=True)
+                <p style="color: #000000; margin: 0.25rem 0 0.5rem 0; font-size: 0.85rem; font-weight: 600;">{_h(employer)}{f" | {_h(location)}" if location else ''}</p>""")
             
             # Mission/Responsibilities
-            if role.get('responsibilities'):
-                st.markdown(f"""
-                <p style="color: #000000; margin: 0.5rem 0; line-height: 1.6; font-size: 0.85rem; text-align: justify;">
-                    {role['responsibilities']}
-                </p>
-                """, unsafe_allow_html=True)
+            if responsibilities:
+                parts.append(f"""<p style="color: #000000; margin: 0.5rem 0; line-height: 1.6; font-size: 0.85rem; text-align: justify;">{_h(responsibilities)}</p>""")
             
             # Achievement Bullets
-            bullets = role.get('ai_bullets', [])
             if bullets:
-                bullets_html = '<ul style="margin: 0.25rem 0; padding-left: 1.2rem; color: #000000;">'
-                for bullet in bullets[:4]:
-                    bullets_html += f'<li style="margin: 0.15rem 0; line-height: 1.4; font-size: 0.83rem; color: #000000;">{bullet}</li>'
-                bullets_html += '</ul>'
-                st.markdown(bullets_html, unsafe_allow_html=True)
+                parts.append(_BULLET_LIST_OPEN + "".join(_BULLET_ITEM.format(_h(bullet)) for bullet in bullets[:4]) + '</ul>')
             
-            st.markdown("</div>", unsafe_allow_html=True)
+            parts.append(_SECTION_CLOSE)
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        _append_more_note(parts, len(work_history), _MAX_ROLES)
+        parts.append(_SECTION_CLOSE)
+        sections.append("\n".join(parts))
     
     # ===== EDUCATION =====
     if education:
-        st.markdown("""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 1.1rem; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                EDUCATION
-            </h2>
-        """, unsafe_allow_html=True)
+        parts = [_open_section("EDUCATION")]
         
-        for edu in education:
-            degree = edu.get('degree', 'Degree')
-            field = edu.get('field_of_study', '')
-            institution = edu.get('institution', 'Institution')
-            year = edu.get('year', 'Year')
-            gpa = edu.get('gpa', '')
+        for edu in education[:_MAX_EDUCATION]:
+            degree, field, institution, year, gpa = _edu_fields(edu)
             
-            gpa_display = f" | GPA: {gpa}" if gpa else ''
+            gpa_display = f" | GPA: {_h(gpa)}" if gpa else ''
             
-            st.markdown(f"""
-            <div style="margin: 0.4rem 0;">
+            parts.append(f"""<div style="margin: 0.4rem 0;">
                 <p style="color: #000000; margin: 0; font-size: 0.83rem; line-height: 1.3;">
-                    <strong>{degree}</strong>{f" in {field}" if field else ''}
+                    <strong>{_h(degree)}</strong>{f" in {_h(field)}" if field else ''}
                 </p>
-                <p style="color: #000000; margin: 0.15rem 0 0 0; font-size: 0.83rem; line-height: 1.3;">
-                    {institution}{f" | {year}" if year else ''}{gpa_display}
-                </p>
-            </div>
-            """, unsafe_allow_html=True)
+                <p style="color: #000000; margin: 0.15rem 0 0 0; font-size: 0.83rem; line-height: 1.3;">{_h(institution)}{f" | {_h(year)}" if year else ''}{gpa_display}</p>
+            </div>""")
         
-        st.markdown("</div>", unsafe_allow_html=True)
+        _append_more_note(parts, len(education), _MAX_EDUCATION)
+        parts.append(_SECTION_CLOSE)
+        sections.append("\n".join(parts))
     
     # ===== CERTIFICATIONS =====
     if certifications:
-        st.markdown("""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 1.1rem; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                CERTIFICATIONS
-            </h2>
-        """, unsafe_allow_html=True)
         # Single column compact list
-        certs_html = '<ul style="margin: 0.3rem 0; padding-left: 1.2rem;">'
-        for cert in certifications:
-            cert_name = cert.get('name', 'Certification')
-            issuer = cert.get('issuer', '')
-            certs_html += f'<li style="margin: 0.15rem 0; font-size: 0.83rem; line-height: 1.3;">{cert_name}{f" – {issuer}" if issuer else ""}</li>'
-        certs_html += '</ul>'
-        st.markdown(certs_html, unsafe_allow_html=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        certs_html = _COMPACT_LIST_OPEN + "".join(
+            _COMPACT_ITEM.format(_h(_cert_label(cert))) for cert in certifications
+        ) + '</ul>'
+        sections.append("\n".join((_open_section("CERTIFICATIONS"), certs_html, _SECTION_CLOSE)))
     
     # ===== VOLUNTEER EXPERIENCE =====
     if volunteer:
-        st.markdown("""
-        <div style="margin: 1.5rem 0;">
-            <h2 style="color: #000000; font-size: 1.1rem; font-weight: 700; text-transform: uppercase; 
-                       letter-spacing: 1px; border-bottom: 2px solid #000000; padding-bottom: 0.25rem; margin: 0 0 0.75rem 0;">
-                VOLUNTEER EXPERIENCE
-            </h2>
-        """, unsafe_allow_html=True)
+        parts = [_open_section("VOLUNTEER EXPERIENCE")]
         # Support both list of strings and list of dict entries
         if volunteer and isinstance(volunteer, list):
             # Detect dict style
             if all(isinstance(v, dict) for v in volunteer):
-                for idx, vol in enumerate(volunteer):
-                    role = vol.get('role') or vol.get('title') or 'Role'
-                    org = vol.get('organization') or vol.get('org') or 'Organization'
-                    date_range = vol.get('date_range') or vol.get('duration') or ''
-                    description = vol.get('description') or ''
+                for idx, vol in enumerate(volunteer[:_MAX_VOLUNTEER]):
+                    role, org, date_range, description = _vol_fields(vol)
                     
-                    st.markdown(f"""
-                    <div style="margin: {'1rem 0 1.5rem 0' if idx > 0 else '0 0 1.5rem 0'}; 
+                    parts.append(f"""<div style="margin: {'1rem 0 1.5rem 0' if idx > 0 else '0 0 1.5rem 0'}; 
                                 padding: 0.75rem; border: 1px solid #cbd5e1; border-radius: 4px; 
                                 background: #f8fafc;">
                         <div style="display: flex; justify-content: space-between; align-items: baseline; margin-bottom: 0.5rem;">
-                            <p style="color: #000000; margin: 0; font-size: 0.9rem; font-weight: 700;">
-                                {org}
-                            </p>
-                            <span style="color: #000000; font-size: 0.8rem; font-style: italic;">
-                                {date_range}
-                            </span>
+                            <p style="color: #000000; margin: 0; font-size: 0.9rem; font-weight: 700;">{_h(org)}</p>
+                            <span style="color: #000000; font-size: 0.8rem; font-style: italic;">{_h(date_range)}</span>
                         </div>
-                        <p style="color: #000000; margin: 0 0 0.5rem 0; font-size: 0.85rem; font-style: italic;">
-                            {role}
-                        </p>
-                        <p style="color: #000000; margin: 0; font-size: 0.83rem; line-height: 1.6; text-align: justify;">
-                            {description}
-                        </p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                        <p style="color: #000000; margin: 0 0 0.5rem 0; font-size: 0.85rem; font-style: italic;">{_h(role)}</p>
+                        <p style="color: #000000; margin: 0; font-size: 0.83rem; line-height: 1.6; text-align: justify;">{_h(description)}</p>
+                    </div>""")
             else:
                 # Treat as bullet list of strings
-                vol_html = '<ul style="margin: 0.3rem 0; padding-left: 1.2rem;">'
-                for v in volunteer:
-                    vol_html += f'<li style="margin: 0.15rem 0; font-size: 0.83rem; line-height: 1.3;">{v}</li>'
-                vol_html += '</ul>'
-                st.markdown(vol_html, unsafe_allow_html=True)
+                parts.append(_COMPACT_LIST_OPEN + "".join(_COMPACT_ITEM.format(_h(v)) for v in volunteer[:_MAX_VOLUNTEER]) + '</ul>')
+            
+            _append_more_note(parts, len(volunteer), _MAX_VOLUNTEER)
         
-        st.markdown("</div>", unsafe_allow_html=True)
-
+        parts.append(_SECTION_CLOSE)
+        sections.append("\n".join(parts))
+    
+    return "\n".join(sections)
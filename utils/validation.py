@@ -4,16 +4,112 @@ Uses Pydantic for validation with visual feedback.
 """
 
 import re
-from typing import Tuple, Optional, Any
+from functools import lru_cache
+from typing import Dict, Tuple, Optional, Any
 from datetime import datetime, date
-from pydantic import EmailStr, ValidationError, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, TypeAdapter, ValidationError, ValidationInfo, field_validator
 from pydantic_core import PydanticCustomError
 
+# Built once: constructing a model/schema per call dominated validate_email
+_EMAIL_ADAPTER = TypeAdapter(EmailStr)
+
+# Plain ASCII addresses that EmailStr is known to accept: length limits, a
+# dot-atom local part, LDH domain labels without IDNA '--' forms and a TLD
+# that is not special-use. Anything else (display names, IDN, quoting...) is
+# left to Pydantic, so the fast path never accepts what EmailStr rejects.
+_EMAIL_ATOM = r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+"
+_EMAIL_RE = re.compile(
+    r"(?=.{1,254}$)(?=[^@]{1,64}@)"
+    rf"{_EMAIL_ATOM}(?:\.{_EMAIL_ATOM})*"
+    r"@(?!.*--)(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+"
+    r"(?!(?:arpa|invalid|local|localhost|onion|test)$)[A-Za-z]{2,63}",
+    re.ASCII | re.IGNORECASE,
+)
+
+# Basic URL pattern
+_URL_RE = re.compile(r'^(https?://)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b')
+
+# Common date formats accepted by validate_date
+_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%m/%Y",
+    "%B %Y",
+    "%b %Y",
+)
+
+
+def _date_shape(text: str) -> Tuple[int, int, bool]:
+    """Separator signature of a date string or format: ('-' count, '/' count, has space)."""
+    return text.count('-'), text.count('/'), ' ' in text
+
+
+# Directives never match '-' or '/', so a value can only parse with formats
+# of the same shape; grouping them up front lets validate_date try one or two
+# formats instead of raising ValueError for each of the six. strptime also
+# lets a format space match tabs or runs of spaces, and %m/%d a space-padded
+# digit, so shapes not listed here fall back to trying every format.
+_DATE_FORMATS_BY_SHAPE = {}
+for _fmt in _DATE_FORMATS:
+    _DATE_FORMATS_BY_SHAPE.setdefault(_date_shape(_fmt), []).append(_fmt)
+del _fmt
+
+
+@lru_cache(maxsize=256)
+def _coerce_date_str(text: str) -> Optional[date]:
+    """Parse a normalised (stripped, lowercased) date string; None for "present"/unparseable."""
+    if text in ("present", "current", ""):
+        return None
+    # Each format's separator rules the other out, so at most one strptime runs
+    fmt = "%Y-%m-%d" if '-' in text else "%m/%d/%Y" if '/' in text else None
+    if fmt is None:
+        return None
+    try:
+        return datetime.strptime(text, fmt).date()
+    except ValueError:
+        return None
+
+
+# Literal (bool, message) returns are already folded into shared code
+# constants by the compiler; only the formatted messages are built per call,
+# so those are cached here.
+@lru_cache(maxsize=64)
+def _phone_length_error(digit_count: int) -> Tuple[bool, str]:
+    return False, f"Phone number must be exactly 10 digits. You entered {digit_count} digits"
+
+
+@lru_cache(maxsize=256)
+def _required_error(field_name: str) -> Tuple[bool, str]:
+    return False, f"{field_name} is required"
+
+
+@lru_cache(maxsize=256)
+def _min_length_error(field_name: str, min_length: int) -> Tuple[bool, str]:
+    return False, f"{field_name} must be at least {min_length} character{'s' if min_length > 1 else ''}"
+
+
+def _coerce_date(value: Any) -> Optional[date]:
+    """Convert a date, datetime or date string to a date (None if not a concrete date)."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return _coerce_date_str(value.strip().lower())
+    return None
+
 
 class FieldValidator:
-    """Real-time field validators with error messages."""
+    """
+    Real-time field validators with error messages.
+    
+    Streamlit reruns call these with the same input on every interaction, so
+    the pure single-string validators memoise their (is_valid, error) result.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_email(value: str) -> Tuple[bool, Optional[str]]:
         """
         Validate email address.
@@ -24,19 +120,20 @@ class FieldValidator:
         if not value or not value.strip():
             return True, None  # Optional field
         
+        # Matched on the raw value: EmailStr strips some surrounding whitespace
+        # but rejects line breaks, so anything padded takes the slow path
+        if _EMAIL_RE.fullmatch(value):
+            return True, None
+        
         try:
-            # Use Pydantic's EmailStr for validation
-            from pydantic import BaseModel, EmailStr
-            
-            class EmailModel(BaseModel):
-                email: EmailStr
-            
-            EmailModel(email=value)
+            # Use Pydantic's EmailStr for everything the fast path does not cover
+            _EMAIL_ADAPTER.validate_python(value)
             return True, None
         except ValidationError:
             return False, "Please enter a valid email address (e.g., name@example.com)"
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_phone(value: str) -> Tuple[bool, Optional[str]]:
         """
         Validate US phone number - requires exactly 10 digits.
@@ -48,24 +145,23 @@ class FieldValidator:
         if not value or not value.strip():
             return False, "Phone number is required"
         
-        # Extract digits only - ignore all formatting characters
-        digits = re.sub(r'\D', '', value.strip())
+        # Count digits only - ignore all formatting characters. One C-level
+        # pass, no digit string is built (str.isdecimal is exactly the set
+        # re's \d matches)
+        digit_count = sum(map(str.isdecimal, value))
         
         # Check if it's empty after removing non-digits
-        if not digits:
+        if not digit_count:
             return False, "Phone number must contain at least one digit"
         
-        # Validate that all characters are digits
-        if not digits.isdigit():
-            return False, "Phone number can only contain digits"
-        
         # Check length: must be exactly 10 digits (US format)
-        if len(digits) == 10:
+        if digit_count == 10:
             return True, None  # Valid 10-digit US number
         else:
-            return False, f"Phone number must be exactly 10 digits. You entered {len(digits)} digits"
+            return _phone_length_error(digit_count)
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_full_name(value: str) -> Tuple[bool, Optional[str]]:
         """
         Validate full name.
@@ -73,13 +169,14 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not value or not value.strip():
+        name = value.strip() if value else ''
+        if not name:
             return False, "Full Name is required"
         
-        if len(value.strip()) < 2:
+        if len(name) < 2:
             return False, "Full Name must be at least 2 characters"
         
-        if len(value.strip()) > 100:
+        if len(name) > 100:
             return False, "Full Name must not exceed 100 characters"
         
         return True, None
@@ -96,7 +193,8 @@ class FieldValidator:
             return True, None  # Optional in some contexts
         
         # More lenient validation for city, state format
-        parts = [p.strip() for p in value.replace(',', ' ').split() if p.strip()]
+        # (split() already drops whitespace, so tokens need no strip)
+        parts = value.replace(',', ' ').split()
         
         if len(parts) < 1:
             return False, "Please enter at least a city name"
@@ -107,6 +205,7 @@ class FieldValidator:
         return True, None
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_linkedin(value: str) -> Tuple[bool, Optional[str]]:
         """
         Validate LinkedIn URL.
@@ -124,6 +223,7 @@ class FieldValidator:
         return True, None
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def validate_url(value: str) -> Tuple[bool, Optional[str]]:
         """
         Validate URL format.
@@ -134,10 +234,9 @@ class FieldValidator:
         if not value or not value.strip():
             return True, None  # Optional field
         
-        # Basic URL pattern
-        url_pattern = r'^(https?://)?(www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b'
-        
-        if not re.match(url_pattern, value):
+        # Every match needs a '.', so dot-less input (mostly mid-typing) is
+        # rejected without entering the regex engine
+        if '.' not in value or not _URL_RE.match(value):
             return False, "Please enter a valid URL"
         
         return True, None
@@ -168,11 +267,12 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not value or not value.strip():
-            return False, f"{field_name} is required"
+        text = value.strip() if value else ''
+        if not text:
+            return _required_error(field_name)
         
-        if len(value.strip()) < min_length:
-            return False, f"{field_name} must be at least {min_length} character{'s' if min_length > 1 else ''}"
+        if len(text) < min_length:
+            return _min_length_error(field_name, min_length)
         
         return True, None
     
@@ -203,17 +303,8 @@ class FieldValidator:
             if value in ["present", "current", ""]:
                 return True, None
             
-            # Try common date formats
-            date_formats = [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-                "%m/%Y",
-                "%B %Y",
-                "%b %Y",
-            ]
-            
-            for fmt in date_formats:
+            # Try the common date formats shaped like the value
+            for fmt in _DATE_FORMATS_BY_SHAPE.get(_date_shape(value), _DATE_FORMATS):
                 try:
                     datetime.strptime(value, fmt)
                     return True, None
@@ -236,31 +327,9 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        from datetime import date as date_type
-        
         # Convert to date objects if needed
-        def to_date(d):
-            if d is None:
-                return None
-            if isinstance(d, datetime):
-                return d.date()
-            if isinstance(d, date_type):
-                return d
-            if isinstance(d, str):
-                d = d.strip().lower()
-                if d in ["present", "current", ""]:
-                    return None
-                try:
-                    return datetime.strptime(d, "%Y-%m-%d").date()
-                except:
-                    try:
-                        return datetime.strptime(d, "%m/%d/%Y").date()
-                    except:
-                        return None
-            return None
-        
-        start = to_date(start_date)
-        end = to_date(end_date)
+        start = _coerce_date(start_date)
+        end = _coerce_date(end_date)
         
         # If either is None or end is "Present", skip validation
         if start is None or end is None:
@@ -271,7 +340,7 @@ class FieldValidator:
             return False, "End date cannot be before start date"
         
         # Check if end date is in the future (beyond today)
-        today = date_type.today()
+        today = date.today()
         if end > today:
             return False, "End date cannot be in the future (use 'Present' for current positions)"
         
@@ -288,21 +357,27 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None or value == "" or str(value).strip() == "":
+        text = '' if value is None else str(value).strip()
+        if not text:
             return True, None  # Optional field
         
-        try:
-            gpa = float(str(value).strip())
-            
-            if gpa < 0:
-                return False, "GPA cannot be negative"
-            
-            if gpa > 100:
-                return False, "GPA value is too high"
-            
-            return True, None
-        except (ValueError, TypeError):
-            return False, "Please enter a valid GPA (e.g., 3.5)"
+        # Digits with at most one '.' always parse; only other input needs
+        # the try/except (signs, exponents, junk)
+        if text.replace('.', '', 1).isdecimal():
+            gpa = float(text)
+        else:
+            try:
+                gpa = float(text)
+            except (ValueError, TypeError):
+                return False, "Please enter a valid GPA (e.g., 3.5)"
+        
+        if gpa < 0:
+            return False, "GPA cannot be negative"
+        
+        if gpa > 100:
+            return False, "GPA value is too high"
+        
+        return True, None
     
     @staticmethod
     def validate_year(value: Any) -> Tuple[bool, Optional[str]]:
@@ -315,26 +390,86 @@ class FieldValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None or value == "" or str(value).strip() == "":
+        text = '' if value is None else str(value).strip()
+        if not text:
             return True, None  # Optional field
         
+        # Four plain digits always parse; only other input needs the try/except
+        # (which also covers int()'s limit on very long digit strings)
+        if len(text) == 4 and text.isdecimal():
+            year = int(text)
+        else:
+            try:
+                year = int(text)
+            except (ValueError, TypeError):
+                return False, "Please enter a valid year (e.g., 2020)"
+        
+        if year < 1950:
+            return False, "Year must be 1950 or later"
+        
+        if year > 2050:
+            return False, "Year must be 2050 or earlier"
+        
+        return True, None
+    
+    @staticmethod
+    def validate_form(data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Validate all Step 1 profile fields in a single model_validate call.
+        
+        Args:
+            data: Profile data keyed by field name (unknown keys are ignored)
+        
+        Returns:
+            Mapping of field name to error message; empty if every field is valid
+        """
         try:
-            year = int(str(value).strip())
-            
-            if year < 1950:
-                return False, "Year must be 1950 or later"
-            
-            if year > 2050:
-                return False, "Year must be 2050 or earlier"
-            
-            return True, None
-        except (ValueError, TypeError):
-            return False, "Please enter a valid year (e.g., 2020)"
+            ProfileFormModel.model_validate(data)
+        except ValidationError as e:
+            return {error['loc'][0]: error['msg'] for error in e.errors()}
+        return {}
+
+
+class ProfileFormModel(BaseModel):
+    """
+    Step 1 profile fields checked with the same rules and messages as the
+    single-field FieldValidator methods, so results can go straight into the
+    per-field validation_errors mapping.
+    """
+    
+    model_config = ConfigDict(extra='ignore', validate_default=True, coerce_numbers_to_str=True)
+    
+    full_name: Optional[str] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    linkedin: Optional[str] = None
+    portfolio: Optional[str] = None
+    years_of_service: Optional[str] = None
+    
+    @field_validator('*')
+    @classmethod
+    def _check_field(cls, value: Optional[str], info: ValidationInfo) -> Optional[str]:
+        is_valid, error_message = _PROFILE_FIELD_CHECKS[info.field_name](value)
+        if not is_valid:
+            raise PydanticCustomError('invalid_field', error_message)
+        return value
+
+
+_PROFILE_FIELD_CHECKS = {
+    'full_name': FieldValidator.validate_full_name,
+    'phone': FieldValidator.validate_phone,
+    'email': FieldValidator.validate_email,
+    'linkedin': FieldValidator.validate_linkedin,
+    'portfolio': FieldValidator.validate_url,
+    'years_of_service': FieldValidator.validate_years_service,
+}
 
 
 class ValidationState:
     """Manages validation state across the app."""
     
+    __slots__ = ('errors',)
+    
     def __init__(self):
         self.errors = {}
     
@@ -342,8 +477,8 @@ class ValidationState:
         """Set or clear error for a field."""
         if error_message:
             self.errors[field_name] = error_message
-        elif field_name in self.errors:
-            del self.errors[field_name]
+        else:
+            self.errors.pop(field_name, None)
     
     def get_error(self, field_name: str) -> Optional[str]:
         """Get error message for a field."""
@@ -351,7 +486,7 @@ class ValidationState:
     
     def has_errors(self) -> bool:
         """Check if there are any validation errors."""
-        return len(self.errors) > 0
+        return bool(self.errors)
     
     def clear(self):
         """Clear all validation errors."""